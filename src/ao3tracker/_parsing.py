@@ -0,0 +1,193 @@
+"""
+String parsing helpers for AO3 work metadata.
+
+Kept free of ao3downloader and other third-party imports, with concrete type
+annotations throughout, so the module can be compiled with mypyc
+(``mypyc src/ao3tracker/_parsing.py``) when batch syncs make these calls hot.
+The pure-Python module is used unchanged when no compiled build is present.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from typing import Optional
+
+
+_WORK_ID_RE = re.compile(r"/works/(\d+)")
+
+
+def _normalize_and_extract(url: str) -> tuple[str, str]:
+    """Return (canonical /works/<id> URL, work ID) from a single regex scan."""
+    m = _WORK_ID_RE.search(url)
+    if not m:
+        raise ValueError(f"Could not extract work ID from URL: {url}")
+    work_id = m.group(1)
+    return f"https://archiveofourown.org/works/{work_id}", work_id
+
+
+def extract_work_id(url: str) -> Optional[str]:
+    """Extract numeric work ID from URL."""
+    m = _WORK_ID_RE.search(url)
+    return m.group(1) if m else None
+
+
+def normalize_work_url(url: str) -> str:
+    """Normalize URL to canonical /works/<id> format."""
+    return _normalize_and_extract(url)[0]
+
+
+def parse_chapters(chapters_str: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    Parse chapter string (e.g., "5/10", "5", "-1") into current and max.
+    
+    Returns:
+        (current, max) tuple. Either can be None if not available.
+    """
+    if not chapters_str or chapters_str == "-1":
+        return None, None
+    
+    # Remove commas and whitespace
+    chapters_str = chapters_str.replace(",", "").strip()
+    
+    # Plain digit halves, the usual case, are converted without the try/except;
+    # anything else (signs, "?", a missing current count) takes the full path
+    current_str, _, max_str = chapters_str.partition("/")
+    current_str = current_str.strip()
+    max_str = max_str.strip()
+    if current_str.isdecimal() and (not max_str or max_str.isdecimal()):
+        return int(current_str), int(max_str) if max_str else None
+    
+    if "/" in chapters_str:
+        try:
+            current = int(current_str) if current_str else None
+            max_chapters = int(max_str) if max_str else None
+            return current, max_chapters
+        except ValueError:
+            return None, None
+    else:
+        try:
+            current = int(chapters_str)
+            return current, None
+        except ValueError:
+            return None, None
+
+
+# Common AO3 date formats, tried in order when the regex fast path misses
+_DATE_FORMATS = (
+    "%d %b %Y",  # 15 Jan 2024
+    "%d %B %Y",  # 15 January 2024
+    "%b %d, %Y",  # Jan 15, 2024
+    "%B %d, %Y",  # January 15, 2024
+    "%Y-%m-%d",  # 2024-01-15
+)
+
+_DATE_RE = re.compile(
+    r"^(?:(\d{4})-(\d{2})-(\d{2})"
+    r"|(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})"
+    r"|([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4}))$"
+)
+
+# Days per month for the ISO short-circuit; Feb 29 falls through to the full
+# path so leap years are still checked
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+_MONTHS = {
+    "jan": 1, "january": 1,
+    "feb": 2, "february": 2,
+    "mar": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5,
+    "jun": 6, "june": 6,
+    "jul": 7, "july": 7,
+    "aug": 8, "august": 8,
+    "sep": 9, "september": 9,
+    "oct": 10, "october": 10,
+    "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}
+
+
+def _build_date(m: re.Match) -> Optional[datetime]:
+    """Build a datetime from a _DATE_RE match, or None if it isn't a valid date."""
+    iso_y, iso_m, iso_d, dmy_d, dmy_mon, dmy_y, mdy_mon, mdy_d, mdy_y = m.groups()
+    try:
+        if iso_y:
+            return datetime(int(iso_y), int(iso_m), int(iso_d))
+        if dmy_y:
+            month = _MONTHS.get(dmy_mon.lower())
+            return datetime(int(dmy_y), month, int(dmy_d)) if month else None
+        month = _MONTHS.get(mdy_mon.lower())
+        return datetime(int(mdy_y), month, int(mdy_d)) if month else None
+    except ValueError:
+        return None
+
+
+def parse_date(date_str: str) -> Optional[str]:
+    """
+    Parse date string to ISO8601 format.
+    
+    Handles various AO3 date formats like "2024-01-15" or "15 Jan 2024".
+    """
+    if not date_str:
+        return None
+    
+    date_str = date_str.strip()
+    
+    # AO3's own published/updated fields are already "YYYY-MM-DD"; append the
+    # midnight time directly instead of round-tripping through datetime.
+    # isascii() keeps non-ASCII digits, which isdecimal() accepts, on the full path
+    if (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str.isascii()
+        and date_str[:4].isdecimal()
+        and date_str[5:7].isdecimal()
+        and date_str[8:].isdecimal()
+        and date_str[:4] != "0000"
+    ):
+        month = int(date_str[5:7])
+        if 1 <= month <= 12 and 1 <= int(date_str[8:]) <= _MONTH_DAYS[month]:
+            return date_str + "T00:00:00"
+    
+    # Fast path: recognize the common AO3 date shapes without strptime
+    m = _DATE_RE.match(date_str)
+    if m:
+        dt = _build_date(m)
+        if dt is not None:
+            return dt.isoformat()
+    
+    # Try ISO format (handles full timestamps)
+    try:
+        dt = datetime.fromisoformat(date_str)
+        return dt.isoformat()
+    except ValueError:
+        pass
+    
+    # Try common date formats
+    for fmt in _DATE_FORMATS:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            return dt.isoformat()
+        except ValueError:
+            continue
+    
+    # If all parsing fails, return as-is (might be in a format we don't recognize)
+    return date_str
+
+
+def parse_words(words_str: str) -> Optional[int]:
+    """Parse word count string (may contain commas) to integer."""
+    if not words_str:
+        return None
+    
+    # Remove commas and whitespace
+    words_str = words_str.replace(",", "").strip()
+    if words_str.isdecimal():
+        return int(words_str)
+    
+    try:
+        return int(words_str) if words_str else None
+    except ValueError:
+        return None
@@ -1,154 +1,250 @@
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 
 DB_PATH = Path("ao3_tracker.db")
 
-
-def get_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+# UTC timestamp generated inside SQLite as ISO-8601 with millisecond precision
+# (YYYY-MM-DDTHH:MM:SS.SSS); datetime.isoformat() values elsewhere carry
+# microseconds, but both share the same prefix, so they still sort together
+_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+# One long-lived connection per thread (route handlers, IMAP ingestion and
+# download jobs run on different threads), tracked so close_db() can release them.
+_local = threading.local()
+_connections: list[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+_generation = 0
+
+
+def _connect(readonly: bool) -> sqlite3.Connection:
+    # Larger statement cache so the per-message/per-work queries stay compiled
+    if readonly:
+        # mode=ro skips the write-side setup; journal_mode is persistent and
+        # already set to WAL by the read-write connection. Autocommit, so the
+        # connection never holds a stale read snapshot open.
+        uri = f"{Path(DB_PATH).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, cached_statements=256, isolation_level=None
+        )
+    else:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    conn.execute("PRAGMA foreign_keys=ON")
+    # Per-thread connections (routes, job threads, progress flushes) contend for
+    # the single writer lock; wait for it rather than raising "database is locked"
+    conn.execute("PRAGMA busy_timeout=5000")
     return conn
 
 
-def init_db():
-    conn = get_connection()
-    cur = conn.cursor()
+def _thread_connection(attr: str, readonly: bool) -> sqlite3.Connection:
+    cached = getattr(_local, attr, None)
+    if cached is not None and cached[1] == _generation:
+        return cached[0]
+    conn = _connect(readonly)
+    setattr(_local, attr, (conn, _generation))
+    with _connections_lock:
+        _connections.append(conn)
+    return conn
 
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS works (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            ao3_id TEXT UNIQUE,
-            title TEXT,
-            author TEXT,
-            url TEXT,
-            last_seen_chapter TEXT,
-            last_update_at TEXT,
-            total_word_count INTEGER
-        )
-    """)
-    
-    # Add total_word_count column if it doesn't exist (for existing databases)
-    cur.execute("""
-        SELECT COUNT(*) FROM pragma_table_info('works') WHERE name='total_word_count'
-    """)
-    if cur.fetchone()[0] == 0:
-        cur.execute("ALTER TABLE works ADD COLUMN total_word_count INTEGER")
-    
-    # Add new metadata columns for scraping integration
-    new_columns = [
-        ('fandoms', 'TEXT'),
-        ('rating', 'TEXT'),
-        ('archive_warnings', 'TEXT'),
-        ('categories', 'TEXT'),
-        ('relationships', 'TEXT'),
-        ('characters', 'TEXT'),
-        ('additional_tags', 'TEXT'),
-        ('language', 'TEXT'),
-        ('chapters_current', 'INTEGER'),
-        ('chapters_max', 'INTEGER'),
-        ('status', 'TEXT'),
-        ('published_at', 'TEXT'),
-        ('updated_at', 'TEXT'),
-        ('summary_html', 'TEXT'),
-        ('metadata_source', 'TEXT'),
-    ]
-    
-    for column_name, column_type in new_columns:
-        cur.execute("""
-            SELECT COUNT(*) FROM pragma_table_info('works') WHERE name=?
-        """, (column_name,))
-        if cur.fetchone()[0] == 0:
-            cur.execute(f"ALTER TABLE works ADD COLUMN {column_name} {column_type}")
-    
-    # Set default metadata_source for existing rows
-    cur.execute("""
-        UPDATE works SET metadata_source = 'email' WHERE metadata_source IS NULL
-    """)
 
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS updates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            work_id INTEGER,
-            chapter_label TEXT,
-            email_subject TEXT,
-            email_date TEXT,
-            chapter_word_count INTEGER,
-            work_word_count INTEGER,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (work_id) REFERENCES works (id)
-        )
-    """)
-    
-    # Add word count columns if they don't exist (for existing databases)
-    cur.execute("""
-        SELECT COUNT(*) FROM pragma_table_info('updates') WHERE name='chapter_word_count'
-    """)
-    if cur.fetchone()[0] == 0:
-        cur.execute("ALTER TABLE updates ADD COLUMN chapter_word_count INTEGER")
-    
-    cur.execute("""
-        SELECT COUNT(*) FROM pragma_table_info('updates') WHERE name='work_word_count'
-    """)
-    if cur.fetchone()[0] == 0:
-        cur.execute("ALTER TABLE updates ADD COLUMN work_word_count INTEGER")
+def get_connection() -> sqlite3.Connection:
+    """
+    Return this thread's shared connection, opening it on first use.
     
-    # Add is_read column if it doesn't exist (for existing databases)
-    cur.execute("""
-        SELECT COUNT(*) FROM pragma_table_info('updates') WHERE name='is_read'
-    """)
-    if cur.fetchone()[0] == 0:
-        cur.execute("ALTER TABLE updates ADD COLUMN is_read INTEGER DEFAULT 0")
+    Callers must not close the returned connection; use close_db() on shutdown.
+    """
+    return _thread_connection("conn", readonly=False)
 
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS processed_messages (
-            message_id TEXT PRIMARY KEY
-        )
-    """)
 
-    # Download jobs table for ao3downloader integration
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS download_jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_type TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'pending',
-            parameters TEXT,
-            result TEXT,
-            error_message TEXT,
-            progress_message TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            started_at TEXT,
-            completed_at TEXT
-        )
-    """)
+def get_readonly_connection() -> sqlite3.Connection:
+    """
+    Return this thread's shared read-only connection, for lookups that never write.
+    
+    The database must already exist (init_db() creates it).
+    """
+    return _thread_connection("ro_conn", readonly=True)
+
+
+def close_db() -> None:
+    """Refresh planner statistics and close every connection opened by this module."""
+    global _generation
+    with _connections_lock:
+        for conn in _connections:
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+        _connections.clear()
+        _generation += 1
+
+
+atexit.register(close_db)
+
+
+# Bump when the migration block in init_db changes so existing databases rerun it
+_SCHEMA_VERSION = 3
+
+# Columns added to works after the original schema
+_WORKS_COLUMNS = [
+    ('total_word_count', 'INTEGER'),
+    ('fandoms', 'TEXT'),
+    ('rating', 'TEXT'),
+    ('archive_warnings', 'TEXT'),
+    ('categories', 'TEXT'),
+    ('relationships', 'TEXT'),
+    ('characters', 'TEXT'),
+    ('additional_tags', 'TEXT'),
+    ('language', 'TEXT'),
+    ('chapters_current', 'INTEGER'),
+    ('chapters_max', 'INTEGER'),
+    ('status', 'TEXT'),
+    ('published_at', 'TEXT'),
+    ('updated_at', 'TEXT'),
+    ('summary_html', 'TEXT'),
+    ('metadata_source', 'TEXT'),
+]
+
+# Columns added to updates after the original schema
+_UPDATES_COLUMNS = [
+    ('chapter_word_count', 'INTEGER'),
+    ('work_word_count', 'INTEGER'),
+    ('is_read', 'INTEGER DEFAULT 0'),
+]
+
+
+def _columns(cur: sqlite3.Cursor, table: str) -> set[str]:
+    return {row[1] for row in cur.execute(f"PRAGMA table_info({table})")}
+
+
+def _migrate_columns(cur: sqlite3.Cursor):
+    """Add any missing columns to databases created by older versions."""
+    for table, wanted in (("works", _WORKS_COLUMNS), ("updates", _UPDATES_COLUMNS)):
+        existing = _columns(cur, table)
+        for column_name, column_type in wanted:
+            if column_name not in existing:
+                cur.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+
+
+# Tables and indexes for a fresh database; column additions happen in _migrate_columns
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS works (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ao3_id TEXT UNIQUE,
+        title TEXT,
+        author TEXT,
+        url TEXT,
+        last_seen_chapter TEXT,
+        last_update_at TEXT,
+        total_word_count INTEGER
+    );
+
+    CREATE TABLE IF NOT EXISTS updates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        work_id INTEGER,
+        chapter_label TEXT,
+        email_subject TEXT,
+        email_date TEXT,
+        chapter_word_count INTEGER,
+        work_word_count INTEGER,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (work_id) REFERENCES works (id)
+    );
+
+    -- work_id lookups use idx_updates_work_read, created once is_read exists (see init_db)
+    CREATE INDEX IF NOT EXISTS idx_updates_created_at ON updates(created_at);
+
+    CREATE TABLE IF NOT EXISTS processed_messages (
+        message_id TEXT PRIMARY KEY
+    );
+
+    -- Highest IMAP UID ingested per mailbox; only valid while uidvalidity matches
+    CREATE TABLE IF NOT EXISTS imap_sync_state (
+        mailbox TEXT PRIMARY KEY,
+        uidvalidity INTEGER NOT NULL,
+        last_uid INTEGER NOT NULL
+    );
+
+    -- Download jobs table for ao3downloader integration
+    CREATE TABLE IF NOT EXISTS download_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_type TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        parameters TEXT,
+        result TEXT,
+        error_message TEXT,
+        progress_message TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        started_at TEXT,
+        completed_at TEXT
+    );
+
+    -- list_jobs: newest first, with and without a status filter
+    CREATE INDEX IF NOT EXISTS idx_download_jobs_status_created ON download_jobs(status, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_download_jobs_created ON download_jobs(created_at DESC);
+
+    -- Download settings table for ao3downloader configuration
+    CREATE TABLE IF NOT EXISTS download_settings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        setting_key TEXT UNIQUE NOT NULL,
+        setting_value TEXT,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Ingestion log table to track when IMAP ingestion runs
+    CREATE TABLE IF NOT EXISTS ingestion_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_at TEXT NOT NULL,
+        completed_at TEXT,
+        status TEXT NOT NULL,
+        messages_processed INTEGER DEFAULT 0,
+        messages_skipped INTEGER DEFAULT 0,
+        error_message TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER);
+"""
 
-    # Download settings table for ao3downloader configuration
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS download_settings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            setting_key TEXT UNIQUE NOT NULL,
-            setting_value TEXT,
-            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
 
-    # Ingestion log table to track when IMAP ingestion runs
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS ingestion_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            started_at TEXT NOT NULL,
-            completed_at TEXT,
-            status TEXT NOT NULL,
-            messages_processed INTEGER DEFAULT 0,
-            messages_skipped INTEGER DEFAULT 0,
-            error_message TEXT
-        )
-    """)
+def init_db():
+    conn = get_connection()
 
-    conn.commit()
-    conn.close()
+    # DDL, migrations and backfills share one transaction: the script opens it
+    # and the with block commits it (or rolls everything back on error)
+    with conn:
+        conn.executescript("BEGIN;\n" + _SCHEMA_SQL)
+        cur = conn.cursor()
+        row = cur.execute("SELECT MAX(version) FROM schema_meta").fetchone()
+        if (row[0] or 0) < _SCHEMA_VERSION:
+            _migrate_columns(cur)
+            # work_id is only a FOREIGN KEY, which SQLite does not index on its own.
+            # (work_id, is_read) also covers the mark-as-read UPDATE, so the older
+            # single-column index is redundant.
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_updates_work_read ON updates(work_id, is_read)")
+            cur.execute("DROP INDEX IF EXISTS idx_updates_work_id")
+            cur.execute("ANALYZE")
+            cur.execute("DELETE FROM schema_meta")
+            cur.execute("INSERT INTO schema_meta (version) VALUES (?)", (_SCHEMA_VERSION,))
+        
+        # Set default metadata_source for existing rows
+        cur.execute("""
+            UPDATE works SET metadata_source = 'email' WHERE metadata_source IS NULL
+        """)
+    
+    # Rebuild statistics for any tables/indexes the schema changes above touched
+    conn.execute("PRAGMA optimize=0x10002")
     
     # Initialize default download settings (import here to avoid circular dependency)
     try:
@@ -159,16 +255,88 @@ def init_db():
         pass
 
 
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    Commit everything written inside the block once, or roll it all back on error.
+    
+    The row-level writers below (mark_processed_message(s), upsert_work_and_add_update,
+    clear_processed_messages) do not commit themselves; wrap batches of them in this.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+
+
+# Hot-path SQL, built once so the strings passed to sqlite3 are identical on
+# every call and always hit the connection's statement cache
+_SQL_HAS_PROCESSED = "SELECT 1 FROM processed_messages WHERE message_id = ?"
+_SQL_MARK_PROCESSED = "INSERT OR IGNORE INTO processed_messages (message_id) VALUES (?)"
+_SQL_INSERT_UPDATE = """
+    INSERT INTO updates (work_id, chapter_label, email_subject, email_date, chapter_word_count, work_word_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+# Use work_word_count as the total if available, otherwise keep existing
+_SQL_UPSERT_WORK = f"""
+    INSERT INTO works (ao3_id, title, author, url, last_seen_chapter, last_update_at, total_word_count)
+    VALUES (?, ?, ?, ?, ?, {_NOW_SQL}, ?)
+    ON CONFLICT(ao3_id) DO UPDATE SET
+        title = excluded.title,
+        author = excluded.author,
+        url = excluded.url,
+        last_seen_chapter = excluded.last_seen_chapter,
+        last_update_at = excluded.last_update_at,
+        total_word_count = COALESCE(excluded.total_word_count, works.total_word_count)
+"""
+_SQL_UPSERT_WORK_RETURNING_ID = _SQL_UPSERT_WORK + "RETURNING id\n"
+
+
 def has_processed_message(conn: sqlite3.Connection, message_id: str) -> bool:
-    cur = conn.cursor()
-    cur.execute("SELECT 1 FROM processed_messages WHERE message_id = ?", (message_id,))
-    return cur.fetchone() is not None
+    return conn.execute(_SQL_HAS_PROCESSED, (message_id,)).fetchone() is not None
 
 
 def mark_processed_message(conn: sqlite3.Connection, message_id: str):
-    cur = conn.cursor()
-    cur.execute("INSERT OR IGNORE INTO processed_messages (message_id) VALUES (?)", (message_id,))
-    conn.commit()
+    conn.execute(_SQL_MARK_PROCESSED, (message_id,))
+
+
+# Stay under SQLite's default host-parameter limit (999 on older builds)
+_MAX_SQL_PARAMS = 900
+
+
+def load_processed_set(conn: sqlite3.Connection) -> set[str]:
+    """Return every processed message ID, for O(1) membership checks in a scan loop."""
+    return {row[0] for row in conn.execute("SELECT message_id FROM processed_messages")}
+
+
+def mark_processed_messages(conn: sqlite3.Connection, message_ids):
+    """Record many message IDs as processed in one executemany call."""
+    conn.executemany(_SQL_MARK_PROCESSED, ((message_id,) for message_id in message_ids))
+
+
+def get_imap_last_uid(conn: sqlite3.Connection, mailbox: str, uidvalidity: int) -> Optional[int]:
+    """Return the highest UID ingested from mailbox, or None if unknown or UIDVALIDITY changed."""
+    row = conn.execute(
+        "SELECT last_uid FROM imap_sync_state WHERE mailbox = ? AND uidvalidity = ?",
+        (mailbox, uidvalidity),
+    ).fetchone()
+    return row[0] if row is not None else None
+
+
+def set_imap_last_uid(conn: sqlite3.Connection, mailbox: str, uidvalidity: int, last_uid: int):
+    """Record the highest UID ingested from mailbox (does not commit)."""
+    conn.execute("""
+        INSERT INTO imap_sync_state (mailbox, uidvalidity, last_uid)
+        VALUES (?, ?, ?)
+        ON CONFLICT(mailbox) DO UPDATE SET
+            uidvalidity = excluded.uidvalidity,
+            last_uid = excluded.last_uid
+    """, (mailbox, uidvalidity, last_uid))
 
 
 def upsert_work_and_add_update(
@@ -190,64 +358,79 @@ def upsert_work_and_add_update(
     """
     cur = conn.cursor()
 
-    cur.execute("SELECT id FROM works WHERE ao3_id = ?", (work["ao3_id"],))
-    row = cur.fetchone()
+    cur.execute(_SQL_UPSERT_WORK_RETURNING_ID, (
+        work["ao3_id"],
+        work["title"],
+        work["author"],
+        work["url"],
+        chapter_label,
+        work_word_count,
+    ))
+    work_id = cur.fetchone()[0]
 
-    from datetime import datetime
-    now_str = datetime.utcnow().isoformat()
+    _add_update(cur, work_id, chapter_label, email_subject, email_date, chapter_word_count, work_word_count)
 
-    # Use work_word_count as the total if available, otherwise keep existing
-    total_word_count = work_word_count
 
-    if row is None:
-        cur.execute("""
-            INSERT INTO works (ao3_id, title, author, url, last_seen_chapter, last_update_at, total_word_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            work["ao3_id"],
-            work["title"],
-            work["author"],
-            work["url"],
-            chapter_label,
-            now_str,
-            total_word_count,
-        ))
-        work_id = cur.lastrowid
-    else:
-        work_id = row["id"]
-        # Only update total_word_count if we have a new value
-        if total_word_count is not None:
-            cur.execute("""
-                UPDATE works
-                SET title = ?, author = ?, url = ?, last_seen_chapter = ?, last_update_at = ?, total_word_count = ?
-                WHERE id = ?
-            """, (
-                work["title"],
-                work["author"],
-                work["url"],
-                chapter_label,
-                now_str,
-                total_word_count,
-                work_id,
-            ))
-        else:
-            cur.execute("""
-                UPDATE works
-                SET title = ?, author = ?, url = ?, last_seen_chapter = ?, last_update_at = ?
-                WHERE id = ?
-            """, (
-                work["title"],
-                work["author"],
-                work["url"],
-                chapter_label,
-                now_str,
-                work_id,
-            ))
+def upsert_works_and_add_updates(conn: sqlite3.Connection, rows: list[Dict[str, Any]]):
+    """
+    Batch form of upsert_work_and_add_update.
+    
+    Each row holds upsert_work_and_add_update's keyword arguments (work,
+    chapter_label, email_subject, email_date and optionally chapter_word_count
+    and work_word_count). Rows are applied in order, so a later email for the
+    same work wins. Does not commit; wrap in transaction().
+    """
+    conn.executemany(_SQL_UPSERT_WORK, [
+        (
+            row["work"]["ao3_id"],
+            row["work"]["title"],
+            row["work"]["author"],
+            row["work"]["url"],
+            row["chapter_label"],
+            row.get("work_word_count"),
+        )
+        for row in rows
+    ])
+    
+    work_ids = load_work_id_map(conn, (row["work"]["ao3_id"] for row in rows))
+    conn.executemany(_SQL_INSERT_UPDATE, [
+        (
+            work_ids[row["work"]["ao3_id"]],
+            row["chapter_label"],
+            row["email_subject"],
+            row["email_date"],
+            row.get("chapter_word_count"),
+            row.get("work_word_count"),
+        )
+        for row in rows
+    ])
+
+
+def load_work_id_map(conn: sqlite3.Connection, ao3_ids: Iterable[str]) -> Dict[str, int]:
+    """Map each ao3_id that already has a works row to its id."""
+    ids = list(set(ao3_ids))
+    work_ids: Dict[str, int] = {}
+    for start in range(0, len(ids), _MAX_SQL_PARAMS):
+        chunk = ids[start:start + _MAX_SQL_PARAMS]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT ao3_id, id FROM works WHERE ao3_id IN ({placeholders})",
+            chunk,
+        )
+        work_ids.update((row[0], row[1]) for row in rows)
+    return work_ids
 
-    cur.execute("""
-        INSERT INTO updates (work_id, chapter_label, email_subject, email_date, chapter_word_count, work_word_count)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (
+
+def _add_update(
+    cur: sqlite3.Cursor,
+    work_id: int,
+    chapter_label: str,
+    email_subject: str,
+    email_date: str,
+    chapter_word_count: Optional[int],
+    work_word_count: Optional[int],
+):
+    cur.execute(_SQL_INSERT_UPDATE, (
         work_id,
         chapter_label,
         email_subject,
@@ -256,14 +439,11 @@ def upsert_work_and_add_update(
         work_word_count,
     ))
 
-    conn.commit()
-
 
 def clear_processed_messages(conn: sqlite3.Connection):
     """Clear all processed message records."""
     cur = conn.cursor()
     cur.execute("DELETE FROM processed_messages")
-    conn.commit()
 
 
 def reset_database():
@@ -272,14 +452,15 @@ def reset_database():
     WARNING: This will delete all data!
     """
     conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("DROP TABLE IF EXISTS updates")
-    cur.execute("DROP TABLE IF EXISTS works")
-    cur.execute("DROP TABLE IF EXISTS processed_messages")
-    
-    conn.commit()
-    conn.close()
+    conn.executescript("""
+        BEGIN;
+        DROP TABLE IF EXISTS updates;
+        DROP TABLE IF EXISTS works;
+        DROP TABLE IF EXISTS processed_messages;
+        DROP TABLE IF EXISTS imap_sync_state;
+        DROP TABLE IF EXISTS schema_meta;
+        COMMIT;
+    """)
     
     # Recreate tables
     init_db()
@@ -289,8 +470,10 @@ def reset_database():
 def reset_processed_messages_only():
     """Reset only the processed_messages table, keeping works and updates."""
     conn = get_connection()
-    clear_processed_messages(conn)
-    conn.close()
+    with transaction(conn):
+        clear_processed_messages(conn)
+        # Without this, the next ingest would only ask IMAP for newer mail
+        conn.execute("DELETE FROM imap_sync_state")
     print("Processed messages table cleared. Works and updates remain intact.")
 
 
@@ -335,107 +518,65 @@ def upsert_work_with_metadata(
     if not ao3_id:
         raise ValueError("ao3_id is required")
     
-    # Check if work exists
-    cur.execute("SELECT id, metadata_source FROM works WHERE ao3_id = ?", (ao3_id,))
-    existing = cur.fetchone()
-    
-    from datetime import datetime
-    now_str = datetime.utcnow().isoformat()
-    
-    # Determine metadata_source
-    if existing:
-        existing_source = existing["metadata_source"] or "email"
-        if existing_source == "email":
-            metadata_source = "mixed"
-        else:
-            metadata_source = existing_source
-    else:
-        metadata_source = work_metadata.get("metadata_source", "scrape")
-    
-    # Prepare values with COALESCE to preserve existing data when new data is None
-    if existing:
-        work_id = existing["id"]
-        # Update existing work, using COALESCE to preserve existing values
-        cur.execute("""
-            UPDATE works SET
-                title = COALESCE(?, title),
-                author = COALESCE(?, author),
-                url = COALESCE(?, url),
-                total_word_count = COALESCE(?, total_word_count),
-                fandoms = COALESCE(?, fandoms),
-                rating = COALESCE(?, rating),
-                archive_warnings = COALESCE(?, archive_warnings),
-                categories = COALESCE(?, categories),
-                relationships = COALESCE(?, relationships),
-                characters = COALESCE(?, characters),
-                additional_tags = COALESCE(?, additional_tags),
-                language = COALESCE(?, language),
-                chapters_current = COALESCE(?, chapters_current),
-                chapters_max = COALESCE(?, chapters_max),
-                status = COALESCE(?, status),
-                published_at = COALESCE(?, published_at),
-                updated_at = COALESCE(?, updated_at),
-                summary_html = COALESCE(?, summary_html),
-                metadata_source = ?,
-                last_update_at = ?
-            WHERE id = ?
-        """, (
-            work_metadata.get("title"),
-            work_metadata.get("author"),
-            work_metadata.get("url"),
-            work_metadata.get("total_word_count"),
-            work_metadata.get("fandoms"),
-            work_metadata.get("rating"),
-            work_metadata.get("archive_warnings"),
-            work_metadata.get("categories"),
-            work_metadata.get("relationships"),
-            work_metadata.get("characters"),
-            work_metadata.get("additional_tags"),
-            work_metadata.get("language"),
-            work_metadata.get("chapters_current"),
-            work_metadata.get("chapters_max"),
-            work_metadata.get("status"),
-            work_metadata.get("published_at"),
-            work_metadata.get("updated_at"),
-            work_metadata.get("summary_html"),
-            metadata_source,
-            now_str,
-            work_id,
-        ))
-    else:
-        # Insert new work
-        cur.execute("""
-            INSERT INTO works (
-                ao3_id, title, author, url, total_word_count,
-                fandoms, rating, archive_warnings, categories, relationships,
-                characters, additional_tags, language, chapters_current, chapters_max,
-                status, published_at, updated_at, summary_html, metadata_source,
-                last_update_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            ao3_id,
-            work_metadata.get("title"),
-            work_metadata.get("author"),
-            work_metadata.get("url"),
-            work_metadata.get("total_word_count"),
-            work_metadata.get("fandoms"),
-            work_metadata.get("rating"),
-            work_metadata.get("archive_warnings"),
-            work_metadata.get("categories"),
-            work_metadata.get("relationships"),
-            work_metadata.get("characters"),
-            work_metadata.get("additional_tags"),
-            work_metadata.get("language"),
-            work_metadata.get("chapters_current"),
-            work_metadata.get("chapters_max"),
-            work_metadata.get("status"),
-            work_metadata.get("published_at"),
-            work_metadata.get("updated_at"),
-            work_metadata.get("summary_html"),
-            metadata_source,
-            now_str,
-        ))
-        work_id = cur.lastrowid
+    # New works take the given metadata_source (default 'scrape'); an existing
+    # email-sourced work becomes 'mixed'. COALESCE preserves existing values
+    # when the new data is None.
+    cur.execute(f"""
+        INSERT INTO works (
+            ao3_id, title, author, url, total_word_count,
+            fandoms, rating, archive_warnings, categories, relationships,
+            characters, additional_tags, language, chapters_current, chapters_max,
+            status, published_at, updated_at, summary_html, metadata_source,
+            last_update_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {_NOW_SQL})
+        ON CONFLICT(ao3_id) DO UPDATE SET
+            title = COALESCE(excluded.title, works.title),
+            author = COALESCE(excluded.author, works.author),
+            url = COALESCE(excluded.url, works.url),
+            total_word_count = COALESCE(excluded.total_word_count, works.total_word_count),
+            fandoms = COALESCE(excluded.fandoms, works.fandoms),
+            rating = COALESCE(excluded.rating, works.rating),
+            archive_warnings = COALESCE(excluded.archive_warnings, works.archive_warnings),
+            categories = COALESCE(excluded.categories, works.categories),
+            relationships = COALESCE(excluded.relationships, works.relationships),
+            characters = COALESCE(excluded.characters, works.characters),
+            additional_tags = COALESCE(excluded.additional_tags, works.additional_tags),
+            language = COALESCE(excluded.language, works.language),
+            chapters_current = COALESCE(excluded.chapters_current, works.chapters_current),
+            chapters_max = COALESCE(excluded.chapters_max, works.chapters_max),
+            status = COALESCE(excluded.status, works.status),
+            published_at = COALESCE(excluded.published_at, works.published_at),
+            updated_at = COALESCE(excluded.updated_at, works.updated_at),
+            summary_html = COALESCE(excluded.summary_html, works.summary_html),
+            metadata_source = CASE COALESCE(works.metadata_source, 'email')
+                WHEN 'email' THEN 'mixed'
+                ELSE works.metadata_source
+            END,
+            last_update_at = excluded.last_update_at
+        RETURNING id
+    """, (
+        ao3_id,
+        work_metadata.get("title"),
+        work_metadata.get("author"),
+        work_metadata.get("url"),
+        work_metadata.get("total_word_count"),
+        work_metadata.get("fandoms"),
+        work_metadata.get("rating"),
+        work_metadata.get("archive_warnings"),
+        work_metadata.get("categories"),
+        work_metadata.get("relationships"),
+        work_metadata.get("characters"),
+        work_metadata.get("additional_tags"),
+        work_metadata.get("language"),
+        work_metadata.get("chapters_current"),
+        work_metadata.get("chapters_max"),
+        work_metadata.get("status"),
+        work_metadata.get("published_at"),
+        work_metadata.get("updated_at"),
+        work_metadata.get("summary_html"),
+        work_metadata.get("metadata_source", "scrape"),
+    ))
+    work_id = cur.fetchone()[0]
     
     conn.commit()
     return work_id
@@ -443,7 +584,6 @@ def upsert_work_with_metadata(
 
 def log_ingestion_start(conn: sqlite3.Connection) -> int:
     """Log the start of an IMAP ingestion run. Returns the log entry ID."""
-    from datetime import datetime
     cur = conn.cursor()
     started_at = datetime.utcnow().isoformat()
     cur.execute("""
@@ -463,7 +603,6 @@ def log_ingestion_complete(
     error_message: Optional[str] = None,
 ):
     """Log the completion of an IMAP ingestion run."""
-    from datetime import datetime
     cur = conn.cursor()
     completed_at = datetime.utcnow().isoformat()
     status = "error" if error_message else "completed"
@@ -4,6 +4,7 @@ Debug script to inspect a single email and see what the parser is getting.
 """
 
 import email
+import re
 import sys
 from email.header import decode_header
 
@@ -19,6 +20,8 @@ from ao3tracker.ingest_imap import (
     parse_ao3_email,
 )
 
+_WORKS_RE = re.compile(r"/works/\d+")
+
 
 def main():
     if len(sys.argv) > 1:
@@ -93,8 +96,7 @@ def main():
         else:
             print("✗ Failed to parse")
             print("\nLooking for /works/ pattern in body:")
-            import re
-            work_matches = re.findall(r"/works/\d+", body)
+            work_matches = _WORKS_RE.findall(body)
             if work_matches:
                 print(f"  Found {len(work_matches)} matches: {work_matches[:5]}")
             else:
@@ -7,7 +7,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from ao3tracker.db import get_connection
+from ao3tracker.db import get_connection, get_readonly_connection
 
 
 # Default settings
@@ -20,38 +20,77 @@ DEFAULT_SETTINGS = {
     "debug_logging": False,
     "extra_wait_time": 0,
     "max_retries": 0,
+    "max_concurrent_downloads": 5,  # Links downloaded in parallel by download_from_file
 }
 
 
+# setting_key -> raw setting_value, loaded from the database on first read and
+# kept in sync by set_setting(); values are decoded per call so callers can't
+# mutate the cached copy
+_settings_cache: Optional[Dict[str, Optional[str]]] = None
+
+
+def _load_settings() -> Dict[str, Optional[str]]:
+    """Return the raw settings cache, reading the table once if needed."""
+    global _settings_cache
+    if _settings_cache is None:
+        rows = get_readonly_connection().execute(
+            "SELECT setting_key, setting_value FROM download_settings"
+        ).fetchall()
+        _settings_cache = {key: value for key, value in rows}
+    return _settings_cache
+
+
+# First characters of stored values that can be JSON other than true/false/null
+_JSON_START = frozenset('{["-0123456789')
+
+
+def _decode_value(value: str) -> Any:
+    """Decode a stored setting value (JSON, or a plain/boolean string)."""
+    # Booleans and plain strings are the common case; only hand values that
+    # can actually be JSON to json.loads, so they don't raise and get caught
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if value == "null":
+        return None
+    if value.lstrip(" \t\n\r")[:1] in _JSON_START:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value
+
+
+def _encode_value(value: Any) -> Optional[str]:
+    """Encode a setting value for storage."""
+    # bool first (it's an int subclass); written exactly as json.dumps would
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None or isinstance(value, str):
+        return value
+    # Convert value to JSON string if it's a container
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
+
 def get_setting(key: str, default: Any = None) -> Any:
     """Get a setting value from database, or return default."""
     # Never return password from database
     if key == "password":
         return default
     
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("SELECT setting_value FROM download_settings WHERE setting_key = ?", (key,))
-    row = cur.fetchone()
-    conn.close()
-    
-    if row is None:
+    settings = _load_settings()
+    if key not in settings:
         # Return default from DEFAULT_SETTINGS if available
         return DEFAULT_SETTINGS.get(key, default)
     
-    value = row["setting_value"]
+    value = settings[key]
     if value is None:
         return default
     
-    # Try to parse as JSON (for lists, dicts, etc.)
-    try:
-        return json.loads(value)
-    except (json.JSONDecodeError, TypeError):
-        # Return as string or boolean
-        if value.lower() in ("true", "false"):
-            return value.lower() == "true"
-        return value
+    return _decode_value(value)
 
 
 def set_setting(key: str, value: Any) -> None:
@@ -60,17 +99,14 @@ def set_setting(key: str, value: Any) -> None:
     if key == "password":
         raise ValueError("Password cannot be stored in database. Passwords must be provided at runtime.")
     
+    settings = _load_settings()
     conn = get_connection()
     cur = conn.cursor()
     
     # Delete any existing password (cleanup for migration)
     cur.execute("DELETE FROM download_settings WHERE setting_key = ?", ("password",))
     
-    # Convert value to JSON string if it's not a string
-    if isinstance(value, (list, dict, bool)):
-        value_str = json.dumps(value)
-    else:
-        value_str = str(value) if value is not None else None
+    value_str = _encode_value(value)
     
     cur.execute("""
         INSERT INTO download_settings (setting_key, setting_value, updated_at)
@@ -81,35 +117,20 @@ def set_setting(key: str, value: Any) -> None:
     """, (key, value_str))
     
     conn.commit()
-    conn.close()
+    settings.pop("password", None)
+    settings[key] = value_str
 
 
 def get_all_settings() -> Dict[str, Any]:
     """Get all settings as a dictionary."""
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("SELECT setting_key, setting_value FROM download_settings")
-    rows = cur.fetchall()
-    conn.close()
-    
     settings = DEFAULT_SETTINGS.copy()
-    for row in rows:
-        key = row["setting_key"]
+    for key, value in _load_settings().items():
         # Skip password - it should never be returned
         if key == "password":
             continue
         
-        value = row["setting_value"]
-        
         if value is not None:
-            try:
-                settings[key] = json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                if value.lower() in ("true", "false"):
-                    settings[key] = value.lower() == "true"
-                else:
-                    settings[key] = value
+            settings[key] = _decode_value(value)
     
     return settings
 
@@ -124,13 +145,16 @@ def get_download_folder() -> Path:
 
 def initialize_default_settings() -> None:
     """Initialize default settings if they don't exist."""
+    global _settings_cache
     conn = get_connection()
-    cur = conn.cursor()
     
-    for key, value in DEFAULT_SETTINGS.items():
-        cur.execute("SELECT 1 FROM download_settings WHERE setting_key = ?", (key,))
-        if cur.fetchone() is None:
-            set_setting(key, value)
+    with conn:
+        # Delete any existing password (cleanup for migration)
+        conn.execute("DELETE FROM download_settings WHERE setting_key = ?", ("password",))
+        conn.executemany("""
+            INSERT OR IGNORE INTO download_settings (setting_key, setting_value, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """, [(key, _encode_value(value)) for key, value in DEFAULT_SETTINGS.items()])
     
-    conn.close()
-
+    # Reload on next read to pick up whichever defaults were inserted
+    _settings_cache = None
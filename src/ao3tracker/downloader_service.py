@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import os
+import sqlite3
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple, Type
 
 from fastapi import BackgroundTasks
+from pydantic import BaseModel
 
 from ao3tracker.db import get_connection
+from ao3tracker.models import (
+    DownloadFromFileRequest,
+    DownloadFromLinkRequest,
+    DownloadMissingSeriesRequest,
+    GetLinksRequest,
+    IgnoreListRequest,
+    MarkedForLaterRequest,
+    PinboardRequest,
+    RedownloadRequest,
+    ScrapeRequest,
+    UpdateIncompleteRequest,
+)
+from ao3tracker.password_utils import decrypt_password
 
 try:
     from ao3tracker.downloader_wrappers import (
@@ -65,29 +88,127 @@ except ImportError as e:
         return {"success": False, "error": "ao3downloader not installed"}
 
 
+class _LRUDict(OrderedDict):
+    """
+    Thread-safe OrderedDict capped at ``maxsize`` entries.
+    
+    Inserting past the cap evicts the least recently touched entries, so
+    job registries stay bounded even if a job's cleanup never runs.
+    """
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+    
+    def touch(self, key) -> None:
+        """Mark an entry as recently used."""
+        with self._lock:
+            if key in self:
+                self.move_to_end(key)
+    
+    def pop(self, key, default=None):
+        with self._lock:
+            return super().pop(key, default)
+
+
+class _LRUSet(_LRUDict):
+    """Set-like view over ``_LRUDict`` for bounded job flags."""
+    
+    def add(self, key) -> None:
+        self[key] = True
+    
+    def discard(self, key) -> None:
+        self.pop(key)
+    
+    def check_and_clear(self, key) -> bool:
+        """Remove a flag and report whether it was set."""
+        return self.pop(key) is not None
+
+
 # Store active job callbacks for progress updates
-_active_jobs: Dict[int, ProgressCallback] = {}
+_active_jobs: _LRUDict = _LRUDict(maxsize=1024)
+# Store running handler tasks so cancel_job can interrupt them
+_job_tasks: _LRUDict = _LRUDict(maxsize=1024)
 # Store cancellation flags for jobs
-_cancelled_jobs: set[int] = set()
+_cancelled_jobs: _LRUSet = _LRUSet(maxsize=4096)
+# Recently fetched jobs, keyed by ID, as (expires_at, job) pairs
+_job_cache: _LRUDict = _LRUDict(maxsize=256)
+_JOB_CACHE_TTL = 1.0
+# Encoded form of an empty parameters/result object
+_EMPTY_JSON = "{}"
+# Rows fetched per round trip when iterating job listings
+_JOB_FETCH_CHUNK = 256
+# Maximum number of downloader calls running at once across all jobs
+_MAX_CONCURRENCY = max(1, int(os.environ.get("AO3TRACKER_MAX_CONCURRENCY", "4")))
+_JOB_SEMAPHORE = asyncio.Semaphore(_MAX_CONCURRENCY)
+# Dedicated pool for blocking scrape jobs so they can't exhaust the default executor
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_CONCURRENCY, thread_name_prefix="ao3-scrape")
+# Column flags for update_job_status
+_FLAG_STATUS = 1
+_FLAG_RESULT = 2
+_FLAG_ERROR = 4
+_FLAG_PROGRESS = 8
+_FLAG_STARTED = 16
+_FLAG_COMPLETED = 32
+# Minimum seconds between persisted progress messages for a running job
+_PROGRESS_FLUSH_INTERVAL = 0.25
+
+
+def _encode_json(value: Dict[str, Any]) -> str:
+    """Encode a JSON object column, reusing a constant for empty payloads."""
+    if not value:
+        return _EMPTY_JSON
+    return json.dumps(value)
 
 
 def create_job(job_type: str, parameters: Dict[str, Any]) -> int:
-    """Create a new download job and return its ID."""
+    """
+    Create a new download job and return its ID.
+    
+    Parameters are validated against the job type's request model when the
+    job runs, so malformed parameters are recorded as a failed job.
+    """
     conn = get_connection()
     cur = conn.cursor()
     
     cur.execute("""
         INSERT INTO download_jobs (job_type, status, parameters)
         VALUES (?, 'pending', ?)
-    """, (job_type, json.dumps(parameters)))
+    """, (job_type, _encode_json(parameters)))
     
     job_id = cur.lastrowid
     conn.commit()
-    conn.close()
     
     return job_id
 
 
+# SET fragments in parameter order, keyed by their column flag
+_UPDATE_FRAGMENTS = (
+    (_FLAG_STATUS, "status = ?"),
+    (_FLAG_RESULT, "result = ?"),
+    (_FLAG_ERROR, "error_message = ?"),
+    (_FLAG_PROGRESS, "progress_message = ?"),
+    # Keep the first start time across repeated "running" progress updates
+    (_FLAG_STARTED, "started_at = COALESCE(started_at, CURRENT_TIMESTAMP)"),
+    (_FLAG_COMPLETED, "completed_at = CURRENT_TIMESTAMP"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _update_sql(mask: int) -> str:
+    """Build the UPDATE statement for a combination of column flags."""
+    assignments = ", ".join(sql for flag, sql in _UPDATE_FRAGMENTS if mask & flag)
+    return f"UPDATE download_jobs SET {assignments} WHERE id = ?"
+
+
 def update_job_status(
     job_id: int,
     status: str,
@@ -99,45 +220,62 @@ def update_job_status(
     conn = get_connection()
     cur = conn.cursor()
     
-    updates = []
     params = []
+    mask = 0
     
     if status:
-        updates.append("status = ?")
         params.append(status)
+        mask |= _FLAG_STATUS
     
     if result is not None:
-        updates.append("result = ?")
-        params.append(json.dumps(result))
+        params.append(_encode_json(result))
+        mask |= _FLAG_RESULT
     
     if error:
-        updates.append("error_message = ?")
         params.append(error)
+        mask |= _FLAG_ERROR
     
     if progress:
-        updates.append("progress_message = ?")
         params.append(progress)
+        mask |= _FLAG_PROGRESS
     
-    if status == "running" and not any("started_at" in s for s in updates):
-        updates.append("started_at = CURRENT_TIMESTAMP")
+    if status == "running":
+        mask |= _FLAG_STARTED
     
     if status in ("completed", "failed"):
-        updates.append("completed_at = CURRENT_TIMESTAMP")
-    
-    params.append(job_id)
+        mask |= _FLAG_COMPLETED
     
-    if updates:
-        query = f"UPDATE download_jobs SET {', '.join(updates)} WHERE id = ?"
-        cur.execute(query, params)
+    if mask:
+        params.append(job_id)
+        cur.execute(_update_sql(mask), params)
         conn.commit()
-    
-    conn.close()
+        _job_cache.pop(job_id)
+
+
+def _job_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Row factory that builds a job dict with its JSON columns decoded."""
+    job = {column[0]: value for column, value in zip(cursor.description, row)}
+    parameters = job["parameters"]
+    job["parameters"] = json.loads(parameters) if parameters else parameters
+    result = job["result"]
+    job["result"] = json.loads(result) if result else result
+    return job
 
 
 def get_job(job_id: int) -> Optional[Dict[str, Any]]:
-    """Get job by ID."""
+    """
+    Get job by ID.
+    
+    Lookups are cached for ``_JOB_CACHE_TTL`` seconds and invalidated by
+    ``update_job_status``; callers must treat the returned dict as read-only.
+    """
+    cached = _job_cache.get(job_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    
     conn = get_connection()
     cur = conn.cursor()
+    cur.row_factory = _job_row_factory
     
     cur.execute("""
         SELECT id, job_type, status, parameters, result, error_message,
@@ -146,25 +284,24 @@ def get_job(job_id: int) -> Optional[Dict[str, Any]]:
         WHERE id = ?
     """, (job_id,))
     
-    row = cur.fetchone()
-    conn.close()
-    
-    if row is None:
-        return None
+    job = cur.fetchone()
     
-    job = dict(row)
-    if job["parameters"]:
-        job["parameters"] = json.loads(job["parameters"])
-    if job["result"]:
-        job["result"] = json.loads(job["result"])
+    if job is not None:
+        _job_cache[job_id] = (time.monotonic() + _JOB_CACHE_TTL, job)
     
     return job
 
 
-def list_jobs(limit: int = 50, status: Optional[str] = None) -> list[Dict[str, Any]]:
-    """List jobs, optionally filtered by status."""
+def iter_jobs(limit: int = 50, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield jobs newest first, optionally filtered by status.
+    
+    Rows are fetched in chunks of ``_JOB_FETCH_CHUNK`` so callers that only
+    read a prefix never materialize the full listing.
+    """
     conn = get_connection()
     cur = conn.cursor()
+    cur.row_factory = _job_row_factory
     
     if status:
         cur.execute("""
@@ -184,40 +321,255 @@ def list_jobs(limit: int = 50, status: Optional[str] = None) -> list[Dict[str, A
             LIMIT ?
         """, (limit,))
     
-    rows = cur.fetchall()
-    conn.close()
+    while True:
+        chunk = cur.fetchmany(_JOB_FETCH_CHUNK)
+        if not chunk:
+            break
+        yield from chunk
+
+
+def list_jobs(limit: int = 50, status: Optional[str] = None) -> list[Dict[str, Any]]:
+    """List jobs, optionally filtered by status."""
+    return list(iter_jobs(limit, status))
+
+
+async def _db(fn, *args, **kwargs):
+    """Run a blocking database helper in a worker thread."""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def _save_progress(job_id: int, progress: str) -> None:
+    """
+    Persist a progress message for a job that is still running.
     
-    jobs = []
-    for row in rows:
-        job = dict(row)
-        if job["parameters"]:
-            job["parameters"] = json.loads(job["parameters"])
-        if job["result"]:
-            job["result"] = json.loads(job["result"])
-        jobs.append(job)
+    Only touches rows in the "running" state, so a flush that lands after
+    the job was completed, failed or cancelled cannot overwrite the outcome.
+    """
+    conn = get_connection()
+    conn.execute(
+        "UPDATE download_jobs SET progress_message = ? WHERE id = ? AND status = 'running'",
+        (progress, job_id),
+    )
+    conn.commit()
+    _job_cache.pop(job_id)
+
+
+def _maybe_decrypt(password: Optional[str]) -> Optional[str]:
+    """Decrypt a stored job password, treating failures as no password."""
+    if not password:
+        return password
+    try:
+        return decrypt_password(password)
+    except Exception:
+        return None
+
+
+async def _bounded(awaitable):
+    """Await a downloader call while holding a slot of the job semaphore."""
+    async with _JOB_SEMAPHORE:
+        return await awaitable
+
+
+async def _flush_progress(job_id: int, progress_callback: ProgressCallback) -> None:
+    """
+    Persist the latest progress message at most once per flush interval.
     
-    return jobs
+    Wrappers can emit many progress messages per second; writing each one
+    to the database floods SQLite with tiny transactions. The callback only
+    buffers messages and this loop writes the newest one when it changed.
+    """
+    # Compared by value, not len(messages): the history is bounded, so its
+    # length stops changing once full
+    last = None
+    while True:
+        await asyncio.sleep(_PROGRESS_FLUSH_INTERVAL)
+        messages = progress_callback.messages
+        if messages and messages[-1] != last:
+            last = messages[-1]
+            _active_jobs.touch(job_id)
+            await _db(_save_progress, job_id, last)
+
+
+async def _handle_download_from_ao3_link(params: DownloadFromLinkRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    if not params.link:
+        raise ValueError("Link parameter is required")
+    return await _bounded(download_from_ao3_link(
+        link=params.link,
+        file_types=params.file_types,
+        pages=params.pages,
+        include_series=params.include_series,
+        download_images=params.download_images,
+        login=params.login,
+        username=params.username,
+        password=_maybe_decrypt(params.password),
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_get_links_only(params: GetLinksRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    if not params.link:
+        raise ValueError("Link parameter is required")
+    return await _bounded(get_links_only(
+        link=params.link,
+        pages=params.pages,
+        include_series=params.include_series,
+        include_metadata=params.include_metadata,
+        login=params.login,
+        username=params.username,
+        password=_maybe_decrypt(params.password),
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_download_from_file(params: DownloadFromFileRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    if not params.file_content:
+        raise ValueError("File content parameter is required")
+    return await _bounded(download_from_file(
+        file_content=params.file_content,
+        file_types=params.file_types,
+        include_series=params.include_series,
+        download_images=params.download_images,
+        login=params.login,
+        username=params.username,
+        password=_maybe_decrypt(params.password),
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_update_incomplete_fics(params: UpdateIncompleteRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    return await _bounded(update_incomplete_fics(
+        folder_path=params.folder_path,
+        file_types=params.file_types,
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_download_missing_from_series(params: DownloadMissingSeriesRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    return await _bounded(download_missing_from_series(
+        folder_path=params.folder_path,
+        file_types=params.file_types,
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_redownload_in_different_format(params: RedownloadRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    return await _bounded(redownload_in_different_format(
+        folder_path=params.folder_path,
+        source_format=params.source_format,
+        target_formats=params.target_formats,
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_download_marked_for_later(params: MarkedForLaterRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    return await _bounded(download_marked_for_later(
+        login=params.login,
+        mark_as_read=params.mark_as_read,
+        username=params.username,
+        password=_maybe_decrypt(params.password),
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_download_pinboard_bookmarks(params: PinboardRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    if not params.api_token:
+        raise ValueError("API token is required")
+    return await _bounded(download_pinboard_bookmarks(
+        api_token=params.api_token,
+        include_unread=params.include_unread,
+        date_from=params.date_from,
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_generate_log_visualization(params: BaseModel, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    return await _bounded(generate_log_visualization(
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_configure_ignore_list(params: IgnoreListRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    if not params.links:
+        raise ValueError("Links parameter is required")
+    return await _bounded(configure_ignore_list(
+        links=params.links,
+        check_deleted=params.check_deleted,
+        progress_callback=progress_callback,
+    ))
+
+
+async def _handle_scrape_works(params: ScrapeRequest, progress_callback: ProgressCallback) -> Optional[Dict[str, Any]]:
+    from ao3tracker.scrape_works import scrape_and_store_works
+    
+    if not params.urls:
+        raise ValueError("URLs parameter is required")
+    
+    password = _maybe_decrypt(params.password)
+    
+    # Run scraping in thread pool with progress callback
+    def _scrape():
+        return scrape_and_store_works(
+            urls=params.urls,
+            force_rescrape=params.force_rescrape,
+            login=params.login,
+            username=params.username,
+            password=password,
+            progress_callback=progress_callback.update,
+        )
+    
+    loop = asyncio.get_running_loop()
+    async with _JOB_SEMAPHORE:
+        future = loop.run_in_executor(_SCRAPE_EXECUTOR, _scrape)
+        try:
+            stats = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The scrape thread keeps running after cancel_job; hold the slot
+            # until it returns so cancelled jobs can't oversubscribe the pool
+            await asyncio.wait((future,))
+            raise
+    return {
+        "success": True,
+        "processed": stats["processed"],
+        "inserted": stats["inserted"],
+        "updated": stats["updated"],
+        "errors": stats["errors"],
+        "message": f"Processed {stats['processed']} URLs: {stats['inserted']} inserted, {stats['updated']} updated, {len(stats['errors'])} errors",
+    }
+
+
+# Job type -> (parameter model, coroutine that runs the job)
+_HANDLERS: Dict[str, Tuple[Type[BaseModel], Callable[[Any, ProgressCallback], Awaitable[Optional[Dict[str, Any]]]]]] = {
+    "download_from_ao3_link": (DownloadFromLinkRequest, _handle_download_from_ao3_link),
+    "get_links_only": (GetLinksRequest, _handle_get_links_only),
+    "download_from_file": (DownloadFromFileRequest, _handle_download_from_file),
+    "update_incomplete_fics": (UpdateIncompleteRequest, _handle_update_incomplete_fics),
+    "download_missing_from_series": (DownloadMissingSeriesRequest, _handle_download_missing_from_series),
+    "redownload_in_different_format": (RedownloadRequest, _handle_redownload_in_different_format),
+    "download_marked_for_later": (MarkedForLaterRequest, _handle_download_marked_for_later),
+    "download_pinboard_bookmarks": (PinboardRequest, _handle_download_pinboard_bookmarks),
+    "generate_log_visualization": (BaseModel, _handle_generate_log_visualization),
+    "configure_ignore_list": (IgnoreListRequest, _handle_configure_ignore_list),
+    "scrape_works": (ScrapeRequest, _handle_scrape_works),
+}
 
 
 async def execute_job(job_id: int, background_tasks: BackgroundTasks) -> None:
     """Execute a download job asynchronously."""
-    job = get_job(job_id)
+    job = await _db(get_job, job_id)
     if not job:
         return
     
     # Check if job was cancelled before starting
-    if job_id in _cancelled_jobs:
-        update_job_status(job_id, "cancelled", progress="Job was cancelled before execution")
-        _cancelled_jobs.discard(job_id)
+    if _cancelled_jobs.check_and_clear(job_id):
+        await _db(update_job_status, job_id, "cancelled", progress="Job was cancelled before execution")
         return
     
-    update_job_status(job_id, "running", progress="Initializing job...")
+    await _db(update_job_status, job_id, "running", progress="Initializing job...")
     
-    # Create progress callback
-    progress_callback = ProgressCallback(
-        lambda msg: update_job_status(job_id, "running", progress=msg)
-    )
+    # Progress messages are buffered on the callback and persisted by the flush task
+    progress_callback = ProgressCallback()
     _active_jobs[job_id] = progress_callback
+    flush_task = asyncio.create_task(_flush_progress(job_id, progress_callback))
     
     try:
         job_type = job["job_type"]
@@ -226,241 +578,63 @@ async def execute_job(job_id: int, background_tasks: BackgroundTasks) -> None:
         if not DOWNLOADER_WRAPPERS_AVAILABLE:
             raise ImportError("ao3downloader wrappers are not available. Please ensure ao3downloader is properly installed.")
         
-        result = None
-        
-        if job_type == "download_from_ao3_link":
-            if not params.get("link"):
-                raise ValueError("Link parameter is required")
-            # Decrypt password if present
-            password = params.get("password")
-            if password:
-                from ao3tracker.password_utils import decrypt_password
-                try:
-                    password = decrypt_password(password)
-                except Exception:
-                    password = None  # If decryption fails, treat as no password
-            result = await download_from_ao3_link(
-                link=params["link"],
-                file_types=params.get("file_types", ["EPUB"]),
-                pages=params.get("pages"),
-                include_series=params.get("include_series", False),
-                download_images=params.get("download_images", False),
-                login=params.get("login", False),
-                username=params.get("username"),
-                password=password,
-                progress_callback=progress_callback,
-            )
-            # Clear password from memory
-            if password:
-                password = None
-        
-        elif job_type == "get_links_only":
-            if not params.get("link"):
-                raise ValueError("Link parameter is required")
-            # Decrypt password if present
-            password = params.get("password")
-            if password:
-                from ao3tracker.password_utils import decrypt_password
-                try:
-                    password = decrypt_password(password)
-                except Exception:
-                    password = None
-            result = await get_links_only(
-                link=params["link"],
-                pages=params.get("pages"),
-                include_series=params.get("include_series", False),
-                include_metadata=params.get("include_metadata", False),
-                login=params.get("login", False),
-                username=params.get("username"),
-                password=password,
-                progress_callback=progress_callback,
-            )
-            # Clear password from memory
-            if password:
-                password = None
-        
-        elif job_type == "download_from_file":
-            if not params.get("file_content"):
-                raise ValueError("File content parameter is required")
-            # Decrypt password if present
-            password = params.get("password")
-            if password:
-                from ao3tracker.password_utils import decrypt_password
-                try:
-                    password = decrypt_password(password)
-                except Exception:
-                    password = None
-            result = await download_from_file(
-                file_content=params["file_content"],
-                file_types=params.get("file_types", ["EPUB"]),
-                include_series=params.get("include_series", True),
-                download_images=params.get("download_images", False),
-                login=params.get("login", False),
-                username=params.get("username"),
-                password=password,
-                progress_callback=progress_callback,
-            )
-            # Clear password from memory
-            if password:
-                password = None
-        
-        elif job_type == "update_incomplete_fics":
-            result = await update_incomplete_fics(
-                folder_path=params["folder_path"],
-                file_types=params.get("file_types", ["EPUB"]),
-                progress_callback=progress_callback,
-            )
-        
-        elif job_type == "download_missing_from_series":
-            result = await download_missing_from_series(
-                folder_path=params["folder_path"],
-                file_types=params.get("file_types", ["EPUB"]),
-                progress_callback=progress_callback,
-            )
-        
-        elif job_type == "redownload_in_different_format":
-            result = await redownload_in_different_format(
-                folder_path=params["folder_path"],
-                source_format=params["source_format"],
-                target_formats=params["target_formats"],
-                progress_callback=progress_callback,
-            )
-        
-        elif job_type == "download_marked_for_later":
-            # Decrypt password if present
-            password = params.get("password")
-            if password:
-                from ao3tracker.password_utils import decrypt_password
-                try:
-                    password = decrypt_password(password)
-                except Exception:
-                    password = None
-            result = await download_marked_for_later(
-                login=params.get("login", True),
-                mark_as_read=params.get("mark_as_read", True),
-                username=params.get("username"),
-                password=password,
-                progress_callback=progress_callback,
-            )
-            # Clear password from memory
-            if password:
-                password = None
-        
-        elif job_type == "download_pinboard_bookmarks":
-            if not params.get("api_token"):
-                raise ValueError("API token is required")
-            result = await download_pinboard_bookmarks(
-                api_token=params["api_token"],
-                include_unread=params.get("include_unread", True),
-                date_from=params.get("date_from"),
-                progress_callback=progress_callback,
-            )
-        
-        elif job_type == "generate_log_visualization":
-            result = await generate_log_visualization(
-                progress_callback=progress_callback,
-            )
-        
-        elif job_type == "configure_ignore_list":
-            if not params.get("links"):
-                raise ValueError("Links parameter is required")
-            result = await configure_ignore_list(
-                links=params["links"],
-                check_deleted=params.get("check_deleted", False),
-                progress_callback=progress_callback,
-            )
-        
-        elif job_type == "scrape_works":
-            from ao3tracker.scrape_works import scrape_and_store_works
-            import asyncio
-            
-            if not params.get("urls"):
-                raise ValueError("URLs parameter is required")
-            
-            # Decrypt password if present
-            password = params.get("password")
-            if password:
-                from ao3tracker.password_utils import decrypt_password
-                try:
-                    password = decrypt_password(password)
-                except Exception:
-                    password = None
-            
-            # Run scraping in thread pool with progress callback
-            def _scrape():
-                return scrape_and_store_works(
-                    urls=params["urls"],
-                    force_rescrape=params.get("force_rescrape", False),
-                    login=params.get("login", False),
-                    username=params.get("username"),
-                    password=password,
-                    progress_callback=lambda msg: progress_callback.update(msg),
-                )
-            
-            # Clear password after use
-            if password:
-                password = None
-            
-            stats = await asyncio.to_thread(_scrape)
-            result = {
-                "success": True,
-                "processed": stats["processed"],
-                "inserted": stats["inserted"],
-                "updated": stats["updated"],
-                "errors": stats["errors"],
-                "message": f"Processed {stats['processed']} URLs: {stats['inserted']} inserted, {stats['updated']} updated, {len(stats['errors'])} errors",
-            }
-        
-        else:
+        entry = _HANDLERS.get(job_type)
+        if entry is None:
             raise ValueError(f"Unknown job type: {job_type}")
+        params_model, handler = entry
+        # ValidationError subclasses ValueError and is reported as invalid parameters
+        job_params = params_model.model_validate(params or {})
+        # Run the handler in its own task so cancel_job can interrupt it at its
+        # next await instead of waiting for the wrapper to return
+        handler_task = asyncio.ensure_future(handler(job_params, progress_callback))
+        _job_tasks[job_id] = handler_task
+        result = await handler_task
         
         # Check if job was cancelled during execution
-        if job_id in _cancelled_jobs or progress_callback.is_cancelled():
-            update_job_status(job_id, "cancelled", progress="Job was cancelled by user")
-            _cancelled_jobs.discard(job_id)
+        if _cancelled_jobs.check_and_clear(job_id) or progress_callback.is_cancelled():
+            await _db(update_job_status, job_id, "cancelled", progress="Job was cancelled by user")
             return
         
         # Check result
         if result is None:
-            update_job_status(job_id, "failed", error="Job returned no result")
+            await _db(update_job_status, job_id, "failed", error="Job returned no result")
         elif result.get("success"):
-            update_job_status(job_id, "completed", result=result, progress="Job completed successfully")
+            await _db(update_job_status, job_id, "completed", result=result, progress="Job completed successfully")
         else:
             error_msg = result.get("error", "Job failed without error message")
-            update_job_status(job_id, "failed", error=error_msg)
+            await _db(update_job_status, job_id, "failed", error=error_msg)
     
-    except ImportError as e:
+    except Exception as e:
         # Check if cancellation caused the exception
-        if job_id in _cancelled_jobs or progress_callback.is_cancelled():
-            update_job_status(job_id, "cancelled", progress="Job was cancelled by user")
-            _cancelled_jobs.discard(job_id)
-        else:
+        if _cancelled_jobs.check_and_clear(job_id) or progress_callback.is_cancelled():
+            await _db(update_job_status, job_id, "cancelled", progress="Job was cancelled by user")
+        elif isinstance(e, ImportError):
             error_msg = f"Import error: {str(e)}. Please ensure ao3downloader is properly installed."
-            update_job_status(job_id, "failed", error=error_msg, progress=error_msg)
-    except ValueError as e:
-        # Check if cancellation caused the exception
-        if job_id in _cancelled_jobs or progress_callback.is_cancelled():
-            update_job_status(job_id, "cancelled", progress="Job was cancelled by user")
-            _cancelled_jobs.discard(job_id)
-        else:
+            await _db(update_job_status, job_id, "failed", error=error_msg, progress=error_msg)
+        elif isinstance(e, ValueError):
             error_msg = f"Invalid parameters: {str(e)}"
-            update_job_status(job_id, "failed", error=error_msg, progress=error_msg)
-    except Exception as e:
-        # Check if cancellation caused the exception
-        if job_id in _cancelled_jobs or progress_callback.is_cancelled():
-            update_job_status(job_id, "cancelled", progress="Job was cancelled by user")
-            _cancelled_jobs.discard(job_id)
+            await _db(update_job_status, job_id, "failed", error=error_msg, progress=error_msg)
         else:
-            import traceback
             error_msg = f"Unexpected error: {str(e)}"
             error_details = traceback.format_exc()
-            update_job_status(job_id, "failed", error=error_msg, progress=error_msg)
+            await _db(update_job_status, job_id, "failed", error=error_msg, progress=error_msg)
             # Log full traceback for debugging
             print(f"Job {job_id} error traceback:\n{error_details}")
+    except asyncio.CancelledError:
+        if job_id in _cancelled_jobs:
+            await _db(update_job_status, job_id, "cancelled", progress="Job was cancelled by user")
+        else:
+            # The worker itself was cancelled (e.g. server shutdown): record it and propagate
+            await _db(update_job_status, job_id, "cancelled", progress="Job was interrupted")
+            raise
     
     finally:
+        # Stop persisting progress; the final status update above already
+        # recorded the closing message
+        flush_task.cancel()
         # Remove from active jobs and cancelled set
         _active_jobs.pop(job_id, None)
+        _job_tasks.pop(job_id)
         _cancelled_jobs.discard(job_id)
 
 
@@ -500,6 +674,11 @@ def cancel_job(job_id: int) -> bool:
     if callback:
         callback.cancel()
     
+    # Interrupt the running handler; cancel_job may be called off the event loop
+    task = _job_tasks.get(job_id)
+    if task is not None:
+        task.get_loop().call_soon_threadsafe(task.cancel)
+    
     # Update job status
     if job["status"] == "running":
         update_job_status(job_id, "cancelled", progress="Job cancelled by user")
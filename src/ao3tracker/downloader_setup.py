@@ -2,16 +2,186 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import logging
+import os
 import subprocess
 import shutil
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# This file is at: src/ao3tracker/downloader_setup.py
+# Go up 3 levels to reach project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_AO3DL_DIR = _PROJECT_ROOT / "ao3downloader"
+_AO3DL_INNER = _AO3DL_DIR / "ao3downloader"
+# Written after a successful install; checked first on later startups
+_AO3DL_OK_MARKER = str(_AO3DL_DIR / ".ao3tracker_ok")
+
+# Absolute path to git, resolved once; None if git is not on PATH
+_GIT_EXE: Optional[str] = shutil.which("git")
+
+# Resolved ao3downloader directory once it is known to be installed
+_installed_dir: Optional[Path] = None
+
+_CLONE_FAIL_TEMPLATE = (
+    "Failed to clone ao3downloader from GitHub.\n"
+    "Error: {err}\n\n"
+    "Please manually clone it to: {dir}\n"
+    "Run: git clone {url} {dir}\n\n"
+    "Or download from: {url}"
+)
+_NO_GIT_TEMPLATE = (
+    "git is not installed. Please install git or manually clone ao3downloader:\n"
+    "  git clone {url} {dir}\n\n"
+    "Or download the repository manually and place it at: {dir}"
+)
+
+# Runs clones off the caller's thread; one worker so installs never race
+_INSTALL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ao3dl-install")
+
+# Clone cache freshness: the stamp inside the cached .git dir is touched on
+# every successful fetch, and caches older than the TTL are refreshed
+_CLONE_CACHE_STAMP = "ao3tracker-fetched"
+_CLONE_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Lines of git stderr kept for error messages
+_GIT_STDERR_TAIL = 64
 
 
 def get_project_root() -> Path:
     """Get the project root directory (where ao3downloader should be placed)."""
-    # This file is at: src/ao3tracker/downloader_setup.py
-    # Go up 3 levels to reach project root
-    return Path(__file__).resolve().parent.parent.parent
+    return _PROJECT_ROOT
+
+
+def _git(*args: str) -> None:
+    """
+    Run a git command, raising CalledProcessError on failure.
+    
+    stdout passes through to the terminal; stderr is streamed and only its
+    last _GIT_STDERR_TAIL lines are kept for the error message, so a long
+    clone transcript is never buffered in full.
+    """
+    argv = [_GIT_EXE, *_git_config_args(), *args]
+    # Fail fast instead of blocking on a credential prompt nobody can answer
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+    proc = subprocess.Popen(argv, stderr=subprocess.PIPE, text=True, env=env)
+    tail = deque(proc.stderr, maxlen=_GIT_STDERR_TAIL)
+    proc.stderr.close()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, argv, stderr="".join(tail))
+
+
+@functools.lru_cache(maxsize=1)
+def _git_version() -> Tuple[int, ...]:
+    """Get the installed git version as a tuple, e.g. (2, 43, 0)."""
+    # "git version 2.43.0" or "git version 2.39.3 (Apple Git-145)"
+    output = subprocess.run([_GIT_EXE, "--version"], check=True, capture_output=True, text=True).stdout
+    words = output.split()
+    version = words[2] if len(words) > 2 else ""
+    return tuple(int(part) for part in version.split(".")[:3] if part.isdigit())
+
+
+def _network_clone_args(repo_url: str, target: Path) -> List[str]:
+    """
+    Build the clone arguments for fetching from the network.
+    
+    ao3tracker only needs a working tree at HEAD, so clones are shallow and
+    single-branch; partial clone (--filter) needs git 2.19 or newer.
+    """
+    args = ["clone", "--depth=1", "--single-branch"]
+    if _git_version() >= (2, 19):
+        args.append("--filter=blob:none")
+    return args + [repo_url, str(target)]
+
+
+@functools.lru_cache(maxsize=1)
+def _git_config_args() -> Tuple[str, ...]:
+    """
+    Get the -c overrides passed to every git command.
+    
+    Protocol v2 skips the full ref advertisement (git 2.18+); the thread and
+    parallelism settings let git pick its own worker counts.
+    """
+    args = ("-c", "pack.threads=0", "-c", "fetch.parallel=0")
+    if _git_version() >= (2, 18):
+        args = ("-c", "protocol.version=2") + args
+    return args
+
+
+def _clone_cache_dir(repo_url: str) -> Path:
+    """Get the user-level clone cache directory for a repository URL."""
+    digest = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()
+    return Path.home() / ".cache" / "ao3tracker" / "clones" / digest
+
+
+def _clone_via_cache(repo_url: str, target: Path) -> None:
+    """
+    Clone repo_url into target through the user-level clone cache.
+    
+    The network is only used to fill an empty cache or to refresh one older
+    than _CLONE_CACHE_TTL; the project copy is always a local clone of the
+    cache. The cache is a full clone, since git ignores --local for a shallow
+    source. Falls back to a shallow direct clone if the cache directory is
+    unusable.
+    """
+    cache_dir = _clone_cache_dir(repo_url)
+    try:
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        _git(*_network_clone_args(repo_url, target))
+        return
+    
+    stamp = cache_dir / ".git" / _CLONE_CACHE_STAMP
+    # Caches written by older versions were shallow; deepen them on next use
+    shallow = (cache_dir / ".git" / "shallow").exists()
+    if not (cache_dir / ".git").is_dir():
+        _git("clone", "--single-branch", repo_url, str(cache_dir))
+        stamp.touch()
+    elif shallow or not stamp.exists() or time.time() - stamp.stat().st_mtime > _CLONE_CACHE_TTL:
+        try:
+            _git("-C", str(cache_dir), "fetch", *(("--unshallow",) if shallow else ()), "origin")
+            _git("-C", str(cache_dir), "reset", "--hard", "FETCH_HEAD")
+            stamp.touch()
+        except subprocess.CalledProcessError as e:
+            # A stale cache is still a usable cache (e.g. when offline)
+            logger.warning("Could not refresh ao3downloader clone cache: %s", e.stderr or e)
+    
+    _git("clone", "--local", str(cache_dir), str(target))
+    # Point origin back at the real repository so a later pull doesn't read
+    # from the (possibly stale or pruned) cache
+    _git("-C", str(target), "remote", "set-url", "origin", repo_url)
+
+
+def _find_installed() -> Optional[Path]:
+    """Get the ao3downloader directory if it is already installed, else None."""
+    global _installed_dir
+    if _installed_dir is None:
+        if not os.access(_AO3DL_OK_MARKER, os.F_OK):
+            # No marker yet (installed before markers existed, or cloned by
+            # hand): the inner package existing implies the checkout does too
+            try:
+                os.stat(_AO3DL_INNER)
+            except OSError:
+                return None
+            _write_ok_marker()
+        _installed_dir = _AO3DL_DIR
+    return _installed_dir
+
+
+def _write_ok_marker() -> None:
+    """Record a complete install so later processes take the marker fast path."""
+    try:
+        open(_AO3DL_OK_MARKER, "a").close()
+    except OSError:
+        # Read-only checkout: fall back to the stat check next time
+        pass
 
 
 def ensure_ao3downloader_installed() -> Path:
@@ -22,45 +192,65 @@ def ensure_ao3downloader_installed() -> Path:
     The ao3downloader directory should be placed at:
         <project_root>/ao3downloader/
     
+    The result is cached once the install is found or cloned, so later calls
+    skip the filesystem checks.
+    
     Returns:
         Path to the ao3downloader directory
     """
-    project_root = get_project_root()
-    ao3downloader_dir = project_root / "ao3downloader"
+    installed = _find_installed()
+    if installed is not None:
+        return installed
+    return ensure_ao3downloader_installed_async().result()
+
+
+def ensure_ao3downloader_installed_async() -> Future:
+    """
+    Start ensuring ao3downloader is installed without blocking the caller.
     
-    # Check if ao3downloader is already installed
-    if ao3downloader_dir.exists() and (ao3downloader_dir / "ao3downloader").exists():
-        # Already installed
-        return ao3downloader_dir
+    Lets startup code overlap other work with a clone. An existing install
+    returns an already-resolved future; otherwise the clone runs on a
+    single-worker executor, so concurrent callers share one clone.
+    
+    Returns:
+        Future resolving to the ao3downloader directory (or raising the
+        RuntimeError from a failed clone)
+    """
+    installed = _find_installed()
+    if installed is not None:
+        future: Future = Future()
+        future.set_result(installed)
+        return future
+    return _INSTALL_EXECUTOR.submit(_install)
+
+
+def _install() -> Path:
+    """Clone ao3downloader into the project root."""
+    global _installed_dir
+    # An earlier queued install may have finished while this one waited
+    installed = _find_installed()
+    if installed is not None:
+        return installed
+    
+    ao3downloader_dir = _AO3DL_DIR
     
     # Try to clone it
-    print("ao3downloader not found. Attempting to clone from GitHub...")
-    print(f"Target location: {ao3downloader_dir}")
+    logger.info("ao3downloader not found, cloning from GitHub to %s", ao3downloader_dir)
     
     repo_url = "https://github.com/nianeyna/ao3downloader.git"
     
+    if _GIT_EXE is None:
+        raise RuntimeError(_NO_GIT_TEMPLATE.format(url=repo_url, dir=ao3downloader_dir))
+    
     try:
-        result = subprocess.run(
-            ["git", "clone", repo_url, str(ao3downloader_dir)],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        print(f"✓ Successfully cloned ao3downloader to {ao3downloader_dir}")
+        _clone_via_cache(repo_url, ao3downloader_dir)
+        _write_ok_marker()
+        logger.info("Cloned ao3downloader to %s", ao3downloader_dir)
+        _installed_dir = ao3downloader_dir
         return ao3downloader_dir
     except subprocess.CalledProcessError as e:
         error_msg = e.stderr or e.stdout or "Unknown error"
         raise RuntimeError(
-            f"Failed to clone ao3downloader from GitHub.\n"
-            f"Error: {error_msg}\n\n"
-            f"Please manually clone it to: {ao3downloader_dir}\n"
-            f"Run: git clone {repo_url} {ao3downloader_dir}\n\n"
-            f"Or download from: {repo_url}"
-        )
-    except FileNotFoundError:
-        raise RuntimeError(
-            "git is not installed. Please install git or manually clone ao3downloader:\n"
-            f"  git clone {repo_url} {ao3downloader_dir}\n\n"
-            f"Or download the repository manually and place it at: {ao3downloader_dir}"
-        )
+            _CLONE_FAIL_TEMPLATE.format(err=error_msg, url=repo_url, dir=ao3downloader_dir)
+        ) from e
 
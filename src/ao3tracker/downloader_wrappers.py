@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import configparser
+import copy
 import csv
-import datetime
+import functools
 import io
+import itertools
+import json
+import mmap
 import os
+import re
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Deque, Dict, Iterator, List, Optional, Callable, Set, Tuple
 
 # Ensure ao3downloader is installed, then add to path
 from ao3tracker.downloader_setup import ensure_ao3downloader_installed
@@ -20,7 +30,7 @@ if str(_AO3_DOWNLOADER_DIR) not in sys.path:
     sys.path.insert(0, str(_AO3_DOWNLOADER_DIR))
 
 try:
-    from ao3downloader import strings
+    from ao3downloader import exceptions, parse_soup, parse_text, strings
     from ao3downloader.actions import shared
     from ao3downloader.ao3 import Ao3
     from ao3downloader.fileio import FileOps
@@ -29,6 +39,9 @@ try:
 except ImportError as e:
     # ao3downloader not available - functions will raise errors when called
     AO3DOWNLOADER_AVAILABLE = False
+    exceptions = None
+    parse_soup = None
+    parse_text = None
     strings = None
     shared = None
     Ao3 = None
@@ -38,22 +51,40 @@ except ImportError as e:
     print(f"Warning: Could not import ao3downloader: {e}")
     traceback.print_exc()
 
-from ao3tracker.downloader_config import get_download_folder, get_setting, set_setting
+from ao3tracker.downloader_config import DEFAULT_SETTINGS, get_setting, set_setting
+
+
+# Most recent progress messages kept per ProgressCallback
+_PROGRESS_HISTORY = max(1, int(os.environ.get("AO3TRACKER_PROGRESS_HISTORY", "500")))
+# Progress messages always forwarded to update_func, however recent the last one
+_MILESTONE_RE = re.compile(r"(Page \d+|Completed|Logged in|Login failed|Warning|Error|Download completed|Found \d+ links)")
 
 
 class ProgressCallback:
-    """Callback for progress updates."""
+    """
+    Callback for progress updates.
     
-    def __init__(self, update_func: Optional[Callable[[str], None]] = None):
+    The last _PROGRESS_HISTORY messages are kept in messages, but
+    update_func is called at most once per min_interval seconds, except for
+    milestone messages (page summaries, login, warnings, completion) which
+    are always forwarded.
+    """
+    
+    def __init__(self, update_func: Optional[Callable[[str], None]] = None, min_interval: float = 0.1):
         self.update_func = update_func
-        self.messages: List[str] = []
+        self.min_interval = min_interval
+        self.messages: Deque[str] = deque(maxlen=_PROGRESS_HISTORY)
         self.cancelled: bool = False
+        self._last_emit = 0.0
     
     def update(self, message: str):
         """Update progress message."""
         self.messages.append(message)
         if self.update_func:
-            self.update_func(message)
+            now = time.monotonic()
+            if now - self._last_emit >= self.min_interval or _MILESTONE_RE.match(message):
+                self._last_emit = now
+                self.update_func(message)
     
     def is_cancelled(self) -> bool:
         """Check if this callback has been cancelled."""
@@ -64,8 +95,66 @@ class ProgressCallback:
         self.cancelled = True
 
 
+@functools.lru_cache(maxsize=1)
+def _downloader_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool that runs blocking ao3downloader work.
+    
+    Created on first use (sized by the max_concurrent_downloads setting) so
+    downloads never compete with other to_thread callers for the default
+    executor, and a burst of jobs queues here instead of growing it.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, int(get_setting("max_concurrent_downloads", 5))),
+        thread_name_prefix="ao3dl",
+    )
+    atexit.register(executor.shutdown, wait=True, cancel_futures=True)
+    return executor
+
+
+async def _run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking downloader call on the downloader executor.
+    
+    The thread cannot be interrupted, so when the awaiting job is cancelled
+    this waits for the call to return before re-raising. The job's semaphore
+    slot is then only released once the executor work has actually stopped.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_downloader_executor(), func, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait((future,))
+        raise
+
+
+def _normalize_file_types(file_types: List[str]) -> List[str]:
+    """Uppercase and de-duplicate file types, keeping their order (e.g. ["epub", "EPUB"] -> ["EPUB"])."""
+    return list(dict.fromkeys(file_type.strip().upper() for file_type in file_types))
+
+
 def create_fileops_with_settings() -> FileOps:
-    """Create FileOps instance with settings from database."""
+    """
+    Create FileOps instance with settings from database.
+    
+    Instances are cached per (download folder, wait, retries) settings, so
+    FileOps.initialize() and the directory/ini setup only run again after one
+    of those settings changes. The instance is shared: copy it before
+    changing its attributes.
+    """
+    # Read the folder setting directly: get_download_folder() would mkdir on
+    # every call, and _make_fileops creates the folder when building
+    return _make_fileops(
+        str(Path(get_setting("download_folder", DEFAULT_SETTINGS["download_folder"]))),
+        get_setting("extra_wait_time", 0),
+        get_setting("max_retries", 0),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _make_fileops(download_folder: str, extra_wait: Any, max_retries: Any) -> FileOps:
+    """Build and initialize a FileOps for the given settings."""
     fileops = FileOps()
     
     # Initialize FileOps - this creates necessary directories (logs, download folder, etc.)
@@ -73,24 +162,250 @@ def create_fileops_with_settings() -> FileOps:
     fileops.initialize()
     
     # Override settings from database
-    download_folder = get_download_folder()
-    fileops.downloadfolder = str(download_folder)
+    fileops.downloadfolder = download_folder
     
     # Ensure download folder exists (initialize() may have created a different one)
-    from pathlib import Path
     Path(fileops.downloadfolder).mkdir(parents=True, exist_ok=True)
     
-    # Update ini values if they exist in database
-    debug_logging = get_setting("debug_logging", False)
-    extra_wait = get_setting("extra_wait_time", 0)
-    max_retries = get_setting("max_retries", 0)
-    
-    # Note: FileOps reads from ini file, but we can set these programmatically
-    # by modifying the ini file or by using the get_ini_value methods with overrides
+    # Repository reads its rate-limit settings via fileops.get_ini_value_integer(),
+    # so mirror our settings into the ini file
+    _sync_ini_settings(fileops, extra_wait, max_retries)
     
     return fileops
 
 
+def _sync_ini_settings(fileops: FileOps, extra_wait: Any, max_retries: Any) -> None:
+    """Write the wait/retry settings to the ini file; _make_fileops caches per settings."""
+    if not strings:
+        return
+    ini_file = fileops.inifile
+    if not os.path.exists(ini_file):
+        return
+    
+    config = configparser.ConfigParser()
+    config.read(ini_file)
+    if 'Settings' not in config:
+        config.add_section('Settings')
+    config.set('Settings', strings.INI_WAIT_TIME, str(extra_wait))
+    config.set('Settings', strings.INI_MAX_RETRIES, str(max_retries))
+    with open(ini_file, 'w') as f:
+        config.write(f)
+
+
+# Connection pool sizes for the adapter shared by every Repository session
+_POOL_CONNECTIONS = 16
+_POOL_MAXSIZE = 64
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_adapter(max_retries: int):
+    """
+    Get the process-wide HTTPS adapter for ao3downloader sessions.
+    
+    Each Repository still gets its own Session (so login cookies never leak
+    between jobs), but mounting this adapter makes them share one pool of
+    kept-alive connections instead of handshaking per Repository. close()
+    is a no-op so Repository.__exit__ cannot tear the shared pool down.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    class _SharedAdapter(HTTPAdapter):
+        def close(self):
+            pass
+    
+    return _SharedAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=Retry(total=max_retries, backoff_factor=0.5, respect_retry_after_header=True),
+    )
+
+
+# Fallback for the prewarm target if ao3downloader's strings aren't loaded
+_AO3_URL = "https://archiveofourown.org"
+
+
+@functools.lru_cache(maxsize=1)
+def _prewarm_connection() -> None:
+    """
+    Open a connection to AO3 in the background, once per process.
+    
+    Called as the first network action starts, so DNS and the TLS handshake
+    overlap with FileOps setup and the visited-list build; the connection is
+    then waiting in the shared pool for the first real request.
+    """
+    def _prewarm():
+        try:
+            import requests
+            with requests.Session() as session:
+                session.mount("https://", _shared_adapter(int(get_setting("max_retries", 0) or 0)))
+                session.head(getattr(strings, "AO3_BASE_URL", _AO3_URL), timeout=5)
+        except Exception:
+            # Only an optimization; the real request reports any network error
+            pass
+    
+    threading.Thread(target=_prewarm, name="ao3dl-prewarm", daemon=True).start()
+
+
+def _use_shared_pool(repo: Repository) -> None:
+    """Route a Repository's HTTPS requests through the shared connection pool."""
+    session = getattr(repo, "session", None)
+    if session is not None:
+        session.mount("https://", _shared_adapter(int(get_setting("max_retries", 0) or 0)))
+
+
+# Visited lists keyed by (download folder, file types), each stored with the
+# (logfile, ignore list, download folder) mtimes it was built from; a changed
+# mtime rebuilds it. The folder's mtime changes when files are added or deleted.
+_VISITED_CACHE: Dict[Tuple[str, Tuple[str, ...]], Tuple[Tuple[int, int, int], List[str]]] = {}
+
+
+def _mtime_ns(path: Optional[str]) -> int:
+    """Get a file's mtime in nanoseconds, or 0 if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        return 0
+
+
+# Ignore lists at least this large are memory-mapped instead of read as text
+_IGNORE_MMAP_MIN = 64 * 1024
+
+
+def _load_ignore_list(path: Path) -> List[str]:
+    """
+    Read the links from an ignore list file.
+    
+    Each line is a link, optionally followed by "; " and a reason; blank
+    lines are skipped. Small files are streamed as text; large ones are
+    memory-mapped and split as bytes, decoding only the link part of each
+    line, so neither is read into memory whole.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _IGNORE_MMAP_MIN:
+            return [line.partition('; ')[0].strip()
+                    for line in io.TextIOWrapper(f, encoding='utf-8') if line.strip()]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            links = []
+            for raw in iter(mm.readline, b''):
+                head = raw.partition(b'; ')[0].strip()
+                if head:
+                    links.append(head.decode('utf-8', 'replace'))
+            return links
+
+
+# Log entries handed to parse_text.get_title_dict at a time
+_LOG_BATCH = 1000
+
+
+def _logged_titles(fileops: FileOps) -> Dict[str, str]:
+    """
+    Build the link -> title dict from the download log.
+    
+    The log is JSON lines, so it is parsed a batch of entries at a time and
+    memory grows with the number of titles rather than the size of the log.
+    Falls back to load_logfile() if the log can't be read that way.
+    """
+    logfile = getattr(fileops, "logfile", None)
+    if logfile and os.path.exists(logfile):
+        titles: Dict[str, str] = {}
+        try:
+            with open(logfile, 'r', encoding='utf-8') as f:
+                entries = (json.loads(line) for line in f if line.strip())
+                while batch := list(itertools.islice(entries, _LOG_BATCH)):
+                    titles.update(parse_text.get_title_dict(batch))
+            return titles
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+    
+    logs = fileops.load_logfile()
+    return parse_text.get_title_dict(logs) if logs else {}
+
+
+def _downloaded_links(fileops: FileOps, titles: Dict[str, str], file_types: List[str], maximum: int) -> List[str]:
+    """
+    Get the logged links whose files are all present in the download folder.
+    
+    Same check as FileOps.file_exists, but against one listing of the
+    download folder instead of a stat per title per file type. Falls back to
+    file_exists if the folder can't be listed.
+    """
+    make_name = getattr(fileops, "get_valid_filename", None)
+    try:
+        existing = set(os.listdir(fileops.downloadfolder))
+    except OSError:
+        existing = None
+    if make_name is None or existing is None:
+        return [x for x in titles if fileops.file_exists(x, titles, file_types, maximum)]
+    
+    suffixes = [f".{file_type.lower()}" for file_type in file_types]
+    visited = []
+    for link, title in titles.items():
+        name = make_name(title, maximum)
+        if all(name + suffix in existing for suffix in suffixes):
+            visited.append(link)
+    return visited
+
+
+def _build_visited(
+    fileops: FileOps,
+    file_types: List[str],
+    progress_callback: Optional[ProgressCallback] = None,
+) -> List[str]:
+    """
+    Build the list of links to skip from the download log and ignore list.
+    
+    Checking every logged title against the download folder costs one stat
+    per title, so the result is cached until the logfile, the ignore list or
+    the download folder's contents change. Callers get a copy, since ao3downloader appends to the list.
+    
+    Args:
+        fileops: FileOps for the current download folder
+        file_types: List of file types being downloaded
+        progress_callback: Optional callback for warnings
+    
+    Returns:
+        List of visited links
+    """
+    ignore_file = Path(fileops.downloadfolder) / (strings.IGNORELIST_FILE_NAME if strings else "ignorelist.txt")
+    key = (str(fileops.downloadfolder), tuple(sorted(file_types)))
+    log_mtime = _mtime_ns(getattr(fileops, "logfile", None))
+    stamps = (log_mtime, _mtime_ns(str(ignore_file)), _mtime_ns(str(fileops.downloadfolder)))
+    
+    cached = _VISITED_CACHE.get(key)
+    if cached is not None and cached[0] == stamps:
+        return list(cached[1])
+    
+    complete = True
+    visited = []
+    try:
+        titles = _logged_titles(fileops)
+        if titles:
+            maximum = fileops.get_ini_value_integer(
+                strings.INI_NAME_LENGTH if strings else "name_length",
+                strings.INI_DEFAULT_NAME_LENGTH if strings else 100
+            )
+            visited = _downloaded_links(fileops, titles, file_types, maximum)
+    except Exception as e:
+        complete = False
+        if progress_callback:
+            progress_callback.update(f"Warning: Could not load visited list: {str(e)}")
+    
+    # Add ignore list items
+    try:
+        if ignore_file.exists():
+            visited.extend(_load_ignore_list(ignore_file))
+    except Exception as e:
+        complete = False
+        if progress_callback:
+            progress_callback.update(f"Warning: Could not load ignore list: {str(e)}")
+    
+    # Only cache a list built without errors, so a failed read is retried
+    if complete and log_mtime:
+        _VISITED_CACHE[key] = (stamps, visited)
+    return list(visited)
+
+
 async def download_from_ao3_link(
     link: str,
     file_types: List[str],
@@ -117,12 +432,16 @@ async def download_from_ao3_link(
     Returns:
         Dict with download results
     """
+    file_types = _normalize_file_types(file_types)
+    
     def _download():
         if not AO3DOWNLOADER_AVAILABLE:
             raise ImportError("ao3downloader is not available")
         
+        _prewarm_connection()
         fileops = create_fileops_with_settings()
         with Repository(fileops) as repo:
+            _use_shared_pool(repo)
             if login:
                 # Get username from settings if not provided
                 if not username:
@@ -143,32 +462,7 @@ async def download_from_ao3_link(
                         password = None
             
             # Build visited list from log files and ignore list
-            visited = []
-            try:
-                logs = fileops.load_logfile()
-                if logs:
-                    from ao3downloader import parse_text
-                    titles = parse_text.get_title_dict(logs)
-                    maximum = fileops.get_ini_value_integer(
-                        strings.INI_NAME_LENGTH if strings else "name_length",
-                        strings.INI_DEFAULT_NAME_LENGTH if strings else 100
-                    )
-                    visited = list({x for x in titles if 
-                        fileops.file_exists(x, titles, file_types, maximum)})
-            except Exception as e:
-                if progress_callback:
-                    progress_callback.update(f"Warning: Could not load visited list: {str(e)}")
-            
-            # Add ignore list items
-            try:
-                ignore_file = Path(fileops.downloadfolder) / (strings.IGNORELIST_FILE_NAME if strings else "ignorelist.txt")
-                if ignore_file.exists():
-                    with open(ignore_file, 'r', encoding='utf-8') as f:
-                        visited.extend([x[:x.find('; ')] if '; ' in x else x.strip() 
-                                       for x in f.readlines() if x.strip()])
-            except Exception as e:
-                if progress_callback:
-                    progress_callback.update(f"Warning: Could not load ignore list: {str(e)}")
+            visited = _build_visited(fileops, file_types, progress_callback)
             
             if progress_callback:
                 progress_callback.update(f"Starting download from {link}...")
@@ -188,7 +482,7 @@ async def download_from_ao3_link(
                 "download_folder": fileops.downloadfolder,
             }
     
-    return await asyncio.to_thread(_download)
+    return await _run_blocking(_download)
 
 
 class ProgressReportingAo3(Ao3):
@@ -200,17 +494,17 @@ class ProgressReportingAo3(Ao3):
         self.links_count = 0
         self.current_page = 0
     
-    def get_work_links_recursive(self, links_list: dict, link: str, visited_series: list, metadata: bool, soup=None):
+    def get_work_links_recursive(self, links_list: dict, link: str, visited_series: Set[str], metadata: bool, soup=None):
         """Override to add progress reporting."""
-        from ao3downloader import parse_text, parse_soup, strings
+        if not isinstance(visited_series, set):
+            # Upstream get_work_links starts the traversal with a list; the
+            # set is passed down the recursion so membership checks are O(1)
+            visited_series = set(visited_series)
         
         if parse_text.is_work(link):
             if link not in links_list:
+                # Counted here, reported once per page below
                 self.links_count += 1
-                if self.progress_callback:
-                    # Extract work ID for display
-                    work_id = parse_text.get_work_number(link) or "unknown"
-                    self.progress_callback.update(f"Found work #{self.links_count}: {work_id}")
                 if metadata:
                     metadata_dict = parse_soup.get_work_metadata_from_list(soup, link)
                     links_list[link] = metadata_dict
@@ -218,7 +512,7 @@ class ProgressReportingAo3(Ao3):
                     links_list[link] = None
         elif parse_text.is_series(link):
             if link not in visited_series:
-                visited_series.append(link)
+                visited_series.add(link)
                 if self.progress_callback:
                     self.progress_callback.update(f"Processing series: {link}")
                 while True:
@@ -247,9 +541,15 @@ class ProgressReportingAo3(Ao3):
                 if self.progress_callback:
                     self.progress_callback.update(f"Page {self.current_page}: Found {len(urls)} works/series")
                 
+                found_before = self.links_count
                 for url in urls:
                     self.get_work_links_recursive(links_list, url, visited_series, metadata, thesoup)
                 
+                if self.progress_callback:
+                    self.progress_callback.update(
+                        f"Page {self.current_page}: +{self.links_count - found_before} works (total {self.links_count})"
+                    )
+                
                 link = parse_text.get_next_page(link)
                 pagenum = parse_text.get_page_number(link)
                 if self.pages and pagenum == self.pages + 1:
@@ -260,7 +560,6 @@ class ProgressReportingAo3(Ao3):
                 if self.progress_callback:
                     self.progress_callback.update(f"Completed page {pagenum - 1}, starting page {pagenum}")
         else:
-            from ao3downloader import exceptions
             raise exceptions.InvalidLinkException(f"Invalid link: {link}")
 
 
@@ -292,28 +591,11 @@ async def get_links_only(
         if not AO3DOWNLOADER_AVAILABLE:
             raise ImportError("ao3downloader is not available")
         
+        _prewarm_connection()
         fileops = create_fileops_with_settings()
         
-        # Ensure Repository has proper retry settings from our config
-        # The Repository class reads from ini file via fileops.get_ini_value_integer()
-        # We need to update the ini file with our settings
-        extra_wait = get_setting("extra_wait_time", 0)
-        max_retries = get_setting("max_retries", 0)
-        
-        # Update ini file with our settings so Repository can use them for rate limiting
-        if strings:
-            ini_file = fileops.inifile
-            if os.path.exists(ini_file):
-                config = configparser.ConfigParser()
-                config.read(ini_file)
-                if 'Settings' not in config:
-                    config.add_section('Settings')
-                config.set('Settings', strings.INI_WAIT_TIME, str(extra_wait))
-                config.set('Settings', strings.INI_MAX_RETRIES, str(max_retries))
-                with open(ini_file, 'w') as f:
-                    config.write(f)
-        
         with Repository(fileops) as repo:
+            _use_shared_pool(repo)
             # Repository automatically handles rate limiting (429 errors) via retry-after header
             # When AO3 returns 429, it reads the 'retry-after' header and waits that many seconds
             # It will wait as long as needed when rate limited - no action needed from us
@@ -348,43 +630,37 @@ async def get_links_only(
             links = ao3.get_work_links(link, include_metadata)
             
             download_folder = Path(fileops.downloadfolder)
-            timestamp = datetime.datetime.now().strftime("%m%d%Y%H%M%S")
+            timestamp = time.strftime("%m%d%Y%H%M%S")
             
             if include_metadata:
                 # Save as CSV
                 filename = f'links_{timestamp}.csv'
                 filepath = download_folder / filename
                 
-                flattened = [flatten_dict(k, v) for k, v in links.items()]
-                if flattened:
-                    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                        keys = list(flattened[0].keys())
-                        writer = csv.DictWriter(f, fieldnames=keys)
-                        writer.writeheader()
-                        for item in flattened:
-                            try:
-                                writer.writerow(item)
-                            except ValueError:
-                                fileops.write_log(item)
+                if links:
+                    # The first work's fields (plus link) make the header
+                    keys = list(flatten_dict(*next(iter(links.items()))))
+                    with open(filepath, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
+                        writer = csv.writer(f)
+                        writer.writerow(keys)
+                        writer.writerows(_csv_rows(links, keys, fileops))
                 
                 if progress_callback:
-                    progress_callback.update(f"Found {len(flattened)} links with metadata")
+                    progress_callback.update(f"Found {len(links)} links with metadata")
                 
                 return {
                     "success": True,
                     "file_path": str(filepath),
                     "filename": filename,
                     "format": "csv",
-                    "count": len(flattened),
+                    "count": len(links),
                 }
             else:
                 # Save as TXT
                 filename = f'links_{timestamp}.txt'
                 filepath = download_folder / filename
                 
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    for l in links:
-                        f.write(l + '\n')
+                filepath.write_text('\n'.join(links) + '\n' if links else '', encoding='utf-8')
                 
                 if progress_callback:
                     progress_callback.update(f"Found {len(links)} links")
@@ -397,13 +673,98 @@ async def get_links_only(
                     "count": len(links),
                 }
     
-    return await asyncio.to_thread(_get_links)
+    return await _run_blocking(_get_links)
 
 
 def flatten_dict(k: str, v: dict) -> dict:
-    """Flatten metadata dict with link key."""
-    v['link'] = k
-    return v
+    """Flatten metadata dict with link key (returns a new dict; v is not modified)."""
+    return {**v, 'link': k}
+
+
+# Write buffer for links CSV files, so rows reach the disk in large writes
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+
+def _csv_rows(links: Dict[str, dict], keys: List[str], fileops: FileOps) -> Iterator[List[Any]]:
+    """
+    Yield CSV rows for link metadata, one list of values per link in key order.
+    
+    Works with fields missing from keys would not fit the header; they are
+    written to the log and skipped. Missing fields are left blank.
+    """
+    known = set(keys)
+    for link, metadata in links.items():
+        if not known.issuperset(metadata):
+            fileops.write_log(flatten_dict(link, metadata))
+            continue
+        yield [link if key == 'link' else metadata.get(key, '') for key in keys]
+
+
+class _ClaimedLinks(list):
+    """
+    Visited list shared by concurrent downloads.
+    
+    Membership tests and appends are guarded by a lock and backed by a set,
+    so threads appending at the same time never corrupt the list. Top-level
+    links are claimed explicitly with claim() before they are handed to
+    Ao3.download, and released with release() if that download fails. Claims
+    are kept apart from the visited links, so `link in visited` stays a pure
+    lookup and a failed download never marks its link as visited.
+    """
+    
+    def __init__(self, links=()):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._seen: Set[str] = set()
+        self._claimed: Set[str] = set()
+        for link in links:
+            self.append(link)
+    
+    def __contains__(self, link) -> bool:
+        with self._lock:
+            return link in self._seen
+    
+    def append(self, link) -> None:
+        with self._lock:
+            if link not in self._seen:
+                self._seen.add(link)
+                super().append(link)
+    
+    def claim(self, link: str) -> bool:
+        """Claim link for one caller; False if it is visited or already claimed."""
+        with self._lock:
+            if link in self._seen or link in self._claimed:
+                return False
+            self._claimed.add(link)
+            return True
+    
+    def release(self, link: str) -> None:
+        """Drop a claim so the link can be tried again."""
+        with self._lock:
+            self._claimed.discard(link)
+
+
+def _download_claimed(ao3: Any, link: str, visited: _ClaimedLinks) -> None:
+    """Download a top-level link unless another task claimed it (blocking)."""
+    if not visited.claim(link):
+        return
+    try:
+        ao3.download(link, visited)
+    except BaseException:
+        visited.release(link)
+        raise
+
+
+def _serialized(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap func so calls from different threads run one at a time."""
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+    
+    return wrapper
 
 
 async def download_from_file(
@@ -430,91 +791,82 @@ async def download_from_file(
     Returns:
         Dict with download results
     """
-    def _download():
-        if not AO3DOWNLOADER_AVAILABLE:
-            raise ImportError("ao3downloader is not available")
-        
-        fileops = create_fileops_with_settings()
-        with Repository(fileops) as repo:
-            if login:
-                # Get username from settings if not provided
-                if not username:
-                    username = get_setting("username", "")
-                if not username or not password:
-                    raise ValueError("Login requested but username and password are required. Please provide them in the request.")
-                try:
-                    repo.login(username, password)
-                    if progress_callback:
-                        progress_callback.update("Logged in successfully")
-                except Exception as e:
-                    if progress_callback:
-                        progress_callback.update(f"Login failed: {str(e)}")
-                    raise
-                finally:
-                    # Clear password from memory
-                    if password:
-                        password = None
-            
-            # Build visited list from log files and ignore list
-            visited = []
+    file_types = _normalize_file_types(file_types)
+    
+    def _prepare(repo, fileops, username, password) -> List[str]:
+        """Log in if requested and build the visited list (blocking)."""
+        if login:
+            # Get username from settings if not provided
+            if not username:
+                username = get_setting("username", "")
+            if not username or not password:
+                raise ValueError("Login requested but username and password are required. Please provide them in the request.")
             try:
-                logs = fileops.load_logfile()
-                if logs:
-                    from ao3downloader import parse_text
-                    titles = parse_text.get_title_dict(logs)
-                    maximum = fileops.get_ini_value_integer(
-                        strings.INI_NAME_LENGTH if strings else "name_length",
-                        strings.INI_DEFAULT_NAME_LENGTH if strings else 100
-                    )
-                    visited = list({x for x in titles if 
-                        fileops.file_exists(x, titles, file_types, maximum)})
-            except Exception as e:
+                repo.login(username, password)
                 if progress_callback:
-                    progress_callback.update(f"Warning: Could not load visited list: {str(e)}")
-            
-            # Add ignore list items
-            try:
-                ignore_file = Path(fileops.downloadfolder) / (strings.IGNORELIST_FILE_NAME if strings else "ignorelist.txt")
-                if ignore_file.exists():
-                    with open(ignore_file, 'r', encoding='utf-8') as f:
-                        visited.extend([x[:x.find('; ')] if '; ' in x else x.strip() 
-                                       for x in f.readlines() if x.strip()])
+                    progress_callback.update("Logged in successfully")
             except Exception as e:
                 if progress_callback:
-                    progress_callback.update(f"Warning: Could not load ignore list: {str(e)}")
-            
-            links = [l.strip() for l in file_content.split('\n') if l.strip()]
-            
-            if progress_callback:
-                progress_callback.update(f"Processing {len(links)} links...")
-            
-            ao3 = Ao3(repo, fileops, file_types, 0, include_series, download_images)
-            
-            results = []
-            for i, link in enumerate(links):
+                    progress_callback.update(f"Login failed: {str(e)}")
+                raise
+            finally:
+                # Clear password from memory
+                if password:
+                    password = None
+        
+        # Build visited list from log files and ignore list
+        return _build_visited(fileops, file_types, progress_callback)
+    
+    if not AO3DOWNLOADER_AVAILABLE:
+        raise ImportError("ao3downloader is not available")
+    
+    _prewarm_connection()
+    # Duplicate lines would otherwise race each other for the same work
+    links = list(dict.fromkeys(l.strip() for l in file_content.split('\n') if l.strip()))
+    
+    # The tasks below share fileops across executor threads: give this call
+    # its own copy whose log writes are serialized
+    fileops = copy.copy(await _run_blocking(create_fileops_with_settings))
+    fileops.write_log = _serialized(fileops.write_log)
+    with Repository(fileops) as repo:
+        _use_shared_pool(repo)
+        visited = _ClaimedLinks(await _run_blocking(_prepare, repo, fileops, username, password))
+        password = None
+        
+        if progress_callback:
+            progress_callback.update(f"Processing {len(links)} links...")
+        
+        # One Ao3 instance (and its session) is shared; only the per-link
+        # download crosses into a worker thread, a bounded number at a time
+        ao3 = Ao3(repo, fileops, file_types, 0, include_series, download_images)
+        semaphore = asyncio.Semaphore(max(1, int(get_setting("max_concurrent_downloads", 5))))
+        
+        async def _download_one(i: int, link: str) -> Dict[str, Any]:
+            async with semaphore:
                 if progress_callback:
                     progress_callback.update(f"Downloading {i+1}/{len(links)}: {link}")
                 try:
-                    ao3.download(link, visited)
-                    results.append({"link": link, "success": True})
+                    await _run_blocking(_download_claimed, ao3, link, visited)
+                    return {"link": link, "success": True}
                 except Exception as e:
-                    results.append({"link": link, "success": False, "error": str(e)})
-            
-            success_count = sum(1 for r in results if r.get("success"))
-            
-            if progress_callback:
-                progress_callback.update(f"Completed: {success_count}/{len(links)} successful")
-            
-            return {
-                "success": True,
-                "total": len(links),
-                "successful": success_count,
-                "failed": len(links) - success_count,
-                "results": results,
-                "download_folder": fileops.downloadfolder,
-            }
+                    return {"link": link, "success": False, "error": str(e)}
+        
+        # Failures are captured per link, so one bad link never cancels the rest
+        results = await asyncio.gather(*(_download_one(i, link) for i, link in enumerate(links)))
+    
+    success_count = sum(1 for r in results if r.get("success"))
+    
+    if progress_callback:
+        progress_callback.update(f"Completed: {success_count}/{len(links)} successful")
     
-    return await asyncio.to_thread(_download)
+    return {
+        "success": True,
+        "total": len(links),
+        "successful": success_count,
+        "failed": len(links) - success_count,
+        "results": list(results),
+        "download_folder": fileops.downloadfolder,
+    }
 
 
 async def update_incomplete_fics(
@@ -536,8 +888,8 @@ async def update_incomplete_fics(
     from ao3downloader.actions import updatefics
     
     def _update():
-        fileops = create_fileops_with_settings()
-        # Override download folder with the specified folder
+        # Override download folder on a copy; the settings FileOps is shared
+        fileops = copy.copy(create_fileops_with_settings())
         fileops.downloadfolder = folder_path
         
         with Repository(fileops) as repo:
@@ -554,7 +906,7 @@ async def update_incomplete_fics(
                 "folder": folder_path,
             }
     
-    return await asyncio.to_thread(_update)
+    return await _run_blocking(_update)
 
 
 async def download_missing_from_series(
@@ -574,7 +926,8 @@ async def download_missing_from_series(
         Dict with download results
     """
     def _download():
-        fileops = create_fileops_with_settings()
+        # Override download folder on a copy; the settings FileOps is shared
+        fileops = copy.copy(create_fileops_with_settings())
         fileops.downloadfolder = folder_path
         
         with Repository(fileops) as repo:
@@ -588,7 +941,7 @@ async def download_missing_from_series(
                 "folder": folder_path,
             }
     
-    return await asyncio.to_thread(_download)
+    return await _run_blocking(_download)
 
 
 async def redownload_in_different_format(
@@ -610,7 +963,8 @@ async def redownload_in_different_format(
         Dict with conversion results
     """
     def _redownload():
-        fileops = create_fileops_with_settings()
+        # Override download folder on a copy; the settings FileOps is shared
+        fileops = copy.copy(create_fileops_with_settings())
         fileops.downloadfolder = folder_path
         
         with Repository(fileops) as repo:
@@ -624,7 +978,7 @@ async def redownload_in_different_format(
                 "folder": folder_path,
             }
     
-    return await asyncio.to_thread(_redownload)
+    return await _run_blocking(_redownload)
 
 
 async def download_marked_for_later(
@@ -678,7 +1032,7 @@ async def download_marked_for_later(
                 "message": "Marked for later download completed",
             }
     
-    return await asyncio.to_thread(_download)
+    return await _run_blocking(_download)
 
 
 async def download_pinboard_bookmarks(
@@ -711,7 +1065,7 @@ async def download_pinboard_bookmarks(
                 "message": "Pinboard download completed",
             }
     
-    return await asyncio.to_thread(_download)
+    return await _run_blocking(_download)
 
 
 async def generate_log_visualization(
@@ -754,7 +1108,7 @@ async def generate_log_visualization(
                 "error": "No log file found",
             }
     
-    return await asyncio.to_thread(_generate)
+    return await _run_blocking(_generate)
 
 
 async def configure_ignore_list(
@@ -784,9 +1138,10 @@ async def configure_ignore_list(
         if progress_callback:
             progress_callback.update("Updating ignore list...")
         
-        with open(ignore_file, 'w', encoding='utf-8') as f:
-            for link in links:
-                f.write(link.strip() + '\n')
+        ignore_file.write_text(
+            '\n'.join(link.strip() for link in links) + '\n' if links else '',
+            encoding='utf-8',
+        )
         
         return {
             "success": True,
@@ -794,5 +1149,5 @@ async def configure_ignore_list(
             "count": len(links),
         }
     
-    return await asyncio.to_thread(_configure)
+    return await _run_blocking(_configure)
 
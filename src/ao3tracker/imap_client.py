@@ -2,10 +2,19 @@ from __future__ import annotations
 
 import imaplib
 import os
-from typing import List, Tuple, Optional
+import re
+from typing import Dict, Iterator, List, Tuple, Optional
 
 IMAP_HOST = "imap.gmail.com"
 
+# Message IDs per FETCH command; keeps the command line well under server limits
+FETCH_BATCH_SIZE = 200
+
+# Sequence number at the start of a FETCH response part: b'12 (BODY[] {3456}'
+_FETCH_SEQ_RE = re.compile(rb"^(\d+) \(")
+# UID inside a UID FETCH response part: b'12 (UID 4711 BODY[] {3456}'
+_FETCH_UID_RE = re.compile(rb"\bUID (\d+)")
+
 
 def get_imap_credentials():
     email_addr = os.environ.get("AO3TRACKER_EMAIL")
@@ -69,9 +78,122 @@ def fetch_message_ids(mail: imaplib.IMAP4_SSL, mailbox: str, limit: Optional[int
     return id_list[-limit:]
 
 
+def get_uidvalidity(mail: imaplib.IMAP4_SSL) -> Optional[int]:
+    """
+    Return the UIDVALIDITY of the mailbox just selected, or None if unknown.
+    
+    UIDs are only comparable between sessions while this value is unchanged.
+    Call right after selecting the mailbox.
+    """
+    _, data = mail.response("UIDVALIDITY")
+    if not data or data[-1] is None:
+        return None
+    try:
+        return int(data[-1])
+    except ValueError:
+        return None
+
+
+def fetch_message_uids(
+    mail: imaplib.IMAP4_SSL,
+    mailbox: str,
+    limit: Optional[int] = 100,
+    after_uid: Optional[int] = None,
+) -> List[bytes]:
+    """
+    Return the UIDs (as bytes) of AO3 messages, oldest first.
+    Like fetch_message_ids, but UIDs stay valid across sessions.
+    
+    Args:
+        limit: Maximum number of messages to return. If None, returns all.
+            Without after_uid these are the most recent; with it they are the
+            oldest ones above after_uid, so successive polls catch up in order.
+        after_uid: Only return messages with a UID greater than this, so a
+            poll only transfers what arrived since the last one.
+    """
+    criteria = []
+    if mailbox != "AO3":
+        # fallback: AO3 emails usually come from archiveofourown.org domain
+        criteria.append('FROM "archiveofourown.org"')
+    if after_uid is not None:
+        criteria.append(f"UID {after_uid + 1}:*")
+    status, data = mail.uid("SEARCH", None, f"({' '.join(criteria)})" if criteria else "ALL")
+
+    if status != "OK":
+        raise RuntimeError("IMAP UID search failed.")
+
+    uid_list = data[0].split()
+    if after_uid is not None:
+        # "N:*" always matches the newest message, even when its UID is below N
+        uid_list = [uid for uid in uid_list if int(uid) > after_uid]
+    if not uid_list:
+        return []
+
+    if limit is None:
+        return uid_list
+    if after_uid is not None:
+        return uid_list[:limit]
+    return uid_list[-limit:]
+
+
 def fetch_raw_message(mail: imaplib.IMAP4_SSL, msg_id: bytes) -> bytes:
     status, msg_data = mail.fetch(msg_id, "(RFC822)")
     if status != "OK":
         raise RuntimeError(f"Failed to fetch message ID {msg_id!r}")
     # msg_data is a list of (part_header, part_body) tuples
     return msg_data[0][1]
+
+
+def fetch_raw_messages(mail: imaplib.IMAP4_SSL, msg_ids: List[bytes], uid: bool = False) -> Dict[bytes, bytes]:
+    """
+    Fetch several messages with a single FETCH command.
+    
+    Uses BODY.PEEK[] so fetching doesn't mark messages as read. Messages
+    missing from the response (e.g. deleted meanwhile) are left out.
+    
+    Args:
+        uid: msg_ids are UIDs (from fetch_message_uids) rather than sequence numbers
+    
+    Returns:
+        Dict mapping message ID to raw message bytes
+    """
+    if not msg_ids:
+        return {}
+    if uid:
+        status, msg_data = mail.uid("FETCH", b",".join(msg_ids), "(BODY.PEEK[])")
+    else:
+        status, msg_data = mail.fetch(b",".join(msg_ids), "(BODY.PEEK[])")
+    if status != "OK":
+        raise RuntimeError(f"Failed to fetch {len(msg_ids)} messages")
+    
+    # msg_data alternates (part_header, part_body) tuples with b')' separators
+    id_re = _FETCH_UID_RE if uid else _FETCH_SEQ_RE
+    messages = {}
+    for part in msg_data:
+        if not isinstance(part, tuple):
+            continue
+        match = id_re.search(part[0])
+        if match:
+            messages[match.group(1)] = part[1]
+    return messages
+
+
+def iter_raw_messages(
+    mail: imaplib.IMAP4_SSL,
+    msg_ids: List[bytes],
+    batch_size: int = FETCH_BATCH_SIZE,
+    uid: bool = False,
+) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    Yield (message ID, raw message) pairs in msg_ids order.
+    
+    Messages are fetched batch_size at a time, so there is one round trip per
+    batch and only one batch is held in memory.
+    """
+    for start in range(0, len(msg_ids), batch_size):
+        batch = msg_ids[start:start + batch_size]
+        messages = fetch_raw_messages(mail, batch, uid=uid)
+        for msg_id in batch:
+            raw = messages.get(msg_id)
+            if raw is not None:
+                yield msg_id, raw
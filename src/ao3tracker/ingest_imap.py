@@ -11,19 +11,40 @@ from bs4 import BeautifulSoup
 from ao3tracker.imap_client import (
     connect_imap,
     select_ao3_mailbox,
-    fetch_message_ids,
-    fetch_raw_message,
+    fetch_message_uids,
+    get_uidvalidity,
+    iter_raw_messages,
 )
 from ao3tracker.db import (
     init_db,
     get_connection,
-    has_processed_message,
-    mark_processed_message,
-    upsert_work_and_add_update,
+    get_readonly_connection,
+    get_imap_last_uid,
+    load_processed_set,
+    mark_processed_messages,
+    set_imap_last_uid,
+    upsert_works_and_add_updates,
     log_ingestion_start,
     log_ingestion_complete,
+    transaction,
 )
 
+_WORK_ID_RE = re.compile(r"/works/(\d+)")
+
+# Parsed updates and processed message IDs are buffered and written in one
+# transaction per batch, so no write lock is held while fetching from IMAP
+_PROCESSED_BATCH_SIZE = 500
+
+
+def _flush_batch(conn, pending_updates: list[dict], pending_ids: set[str]) -> None:
+    """Write buffered updates and processed message IDs in a single transaction."""
+    with transaction(conn):
+        if pending_updates:
+            upsert_works_and_add_updates(conn, pending_updates)
+        mark_processed_messages(conn, pending_ids)
+    pending_updates.clear()
+    pending_ids.clear()
+
 
 def decode_header_value(raw: Optional[str]) -> str:
     if not raw:
@@ -111,7 +132,7 @@ def parse_ao3_email(body: str, content_type: str, email_subject: str) -> Optiona
     """
     # Try to extract work ID and URL from the body
     # Look for /works/ pattern in both HTML and plain text
-    work_id_match = re.search(r"/works/(\d+)", body)
+    work_id_match = _WORK_ID_RE.search(body)
     if not work_id_match:
         return None
     
@@ -316,32 +337,39 @@ def parse_ao3_email(body: str, content_type: str, email_subject: str) -> Optiona
 def ingest_new_ao3_emails_imap(max_messages: Optional[int] = 100):
     init_db()
     conn = get_connection()
+    # Load every processed ID once (read-only) so the per-message check is a set lookup
+    processed_ids = load_processed_set(get_readonly_connection())
     
     # Log the start of ingestion
     log_id = log_ingestion_start(conn)
     error_message = None
+    pending_updates: list[dict] = []
+    pending_ids: set[str] = set()
 
     mail = connect_imap()
     try:
         mailbox = select_ao3_mailbox(mail)
         print(f"Selected mailbox: {mailbox}")
 
-        msg_ids = fetch_message_ids(mail, mailbox, limit=max_messages)
+        # Only ask the server for messages newer than the last run's, as long
+        # as the mailbox's UIDs are still the same ones (same UIDVALIDITY)
+        uidvalidity = get_uidvalidity(mail)
+        last_uid = get_imap_last_uid(conn, mailbox, uidvalidity) if uidvalidity is not None else None
+        msg_ids = fetch_message_uids(mail, mailbox, limit=max_messages, after_uid=last_uid)
         print(f"Found {len(msg_ids)} candidate AO3 messages.")
 
         processed_count = 0
         skipped_count = 0
 
-        for msg_id in msg_ids:
+        for msg_id, raw in iter_raw_messages(mail, msg_ids, uid=True):
             imap_seq = msg_id.decode("ascii", errors="ignore")
             
-            raw = fetch_raw_message(mail, msg_id)
             msg = email.message_from_bytes(raw)
 
             # Get a stable message identifier (prefer Message-ID header)
             stable_msg_id = get_stable_message_id(msg, imap_seq)
             
-            if has_processed_message(conn, stable_msg_id):
+            if stable_msg_id in processed_ids or stable_msg_id in pending_ids:
                 skipped_count += 1
                 continue
 
@@ -362,13 +390,13 @@ def ingest_new_ao3_emails_imap(max_messages: Optional[int] = 100):
             body, content_type = extract_body_from_email(msg)
             if not body:
                 print(f"[WARN] No body found for message {imap_seq} (ID: {stable_msg_id})")
-                mark_processed_message(conn, stable_msg_id)
+                pending_ids.add(stable_msg_id)
                 continue
 
             parsed = parse_ao3_email(body, content_type, subject)
             if not parsed:
                 print(f"[WARN] Could not parse AO3 info from message {imap_seq} (subject: {subject!r}, type: {content_type})")
-                mark_processed_message(conn, stable_msg_id)
+                pending_ids.add(stable_msg_id)
                 continue
 
             work = {
@@ -378,18 +406,32 @@ def ingest_new_ao3_emails_imap(max_messages: Optional[int] = 100):
                 "url": parsed["url"],
             }
 
-            upsert_work_and_add_update(
-                conn=conn,
-                work=work,
-                chapter_label=parsed["chapter_label"],
-                email_subject=subject,
-                email_date=date,
-                chapter_word_count=parsed.get("chapter_word_count"),
-                work_word_count=parsed.get("work_word_count"),
-            )
-            mark_processed_message(conn, stable_msg_id)
+            pending_updates.append({
+                "work": work,
+                "chapter_label": parsed["chapter_label"],
+                "email_subject": subject,
+                "email_date": date,
+                "chapter_word_count": parsed.get("chapter_word_count"),
+                "work_word_count": parsed.get("work_word_count"),
+            })
+            pending_ids.add(stable_msg_id)
             processed_count += 1
             print(f"[OK] {work['title']} – {parsed['chapter_label']} ({subject})")
+            
+            if len(pending_ids) >= _PROCESSED_BATCH_SIZE:
+                # Keep flushed IDs visible to the duplicate check for the rest of the run
+                processed_ids.update(pending_ids)
+                _flush_batch(conn, pending_updates, pending_ids)
+
+        if pending_ids:
+            _flush_batch(conn, pending_updates, pending_ids)
+        # With a mark, the oldest UIDs above it were fetched, so everything up to
+        # the highest one is stored. A first run fetched only the newest
+        # messages; recording a mark after a truncated one would skip older mail
+        complete = last_uid is not None or max_messages is None or len(msg_ids) < max_messages
+        if msg_ids and uidvalidity is not None and complete:
+            with transaction(conn):
+                set_imap_last_uid(conn, mailbox, uidvalidity, max(int(uid) for uid in msg_ids))
 
         print(f"Done. Processed {processed_count} new messages, skipped {skipped_count} already-seen.")
 
@@ -403,6 +445,8 @@ def ingest_new_ao3_emails_imap(max_messages: Optional[int] = 100):
             mail.logout()
         except:
             pass
+        if pending_ids:
+            _flush_batch(conn, pending_updates, pending_ids)
         # Log the completion of ingestion
         log_ingestion_complete(
             conn,
@@ -411,7 +455,6 @@ def ingest_new_ao3_emails_imap(max_messages: Optional[int] = 100):
             messages_skipped=skipped_count,
             error_message=error_message,
         )
-        conn.close()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from ao3tracker import routes_api, routes_html
-from ao3tracker.db import init_db
+from ao3tracker.db import close_db, init_db
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +92,12 @@ async def startup_event():
     asyncio.create_task(periodic_imap_ingestion())
     logger.info("Started periodic IMAP ingestion task (runs every 15 minutes)")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled database connections."""
+    close_db()
+
 # Set up templates for downloader (always available)
 from fastapi.templating import Jinja2Templates
 TEMPLATES_DIR = BASE_DIR / "templates"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -85,3 +85,77 @@ class WorksResponse(PaginatedResponse):
     """Paginated works response."""
     items: list[Work]
 
+
+# Downloader job requests; also used to validate stored job parameters
+class DownloadFromLinkRequest(BaseModel):
+    link: str
+    file_types: List[str] = ["EPUB"]
+    pages: Optional[int] = None
+    include_series: bool = False
+    download_images: bool = False
+    login: bool = False
+    username: Optional[str] = None
+    password: Optional[str] = None  # Required if login=True, encrypted in memory
+
+
+class GetLinksRequest(BaseModel):
+    link: str
+    pages: Optional[int] = None
+    include_series: bool = False
+    include_metadata: bool = False
+    login: bool = False
+    username: Optional[str] = None
+    password: Optional[str] = None  # Required if login=True, encrypted in memory
+
+
+class DownloadFromFileRequest(BaseModel):
+    file_content: str
+    file_types: List[str] = ["EPUB"]
+    include_series: bool = True
+    download_images: bool = False
+    login: bool = False
+    username: Optional[str] = None
+    password: Optional[str] = None  # Required if login=True, encrypted in memory
+
+
+class UpdateIncompleteRequest(BaseModel):
+    folder_path: str
+    file_types: List[str] = ["EPUB"]
+
+
+class DownloadMissingSeriesRequest(BaseModel):
+    folder_path: str
+    file_types: List[str] = ["EPUB"]
+
+
+class RedownloadRequest(BaseModel):
+    folder_path: str
+    source_format: str
+    target_formats: List[str]
+
+
+class MarkedForLaterRequest(BaseModel):
+    login: bool = True
+    mark_as_read: bool = True
+    username: Optional[str] = None
+    password: Optional[str] = None  # Required if login=True, encrypted in memory
+
+
+class PinboardRequest(BaseModel):
+    api_token: str
+    include_unread: bool = True
+    date_from: Optional[str] = None
+
+
+class IgnoreListRequest(BaseModel):
+    links: List[str]
+    check_deleted: bool = False
+
+
+class ScrapeRequest(BaseModel):
+    """Request model for scraping works from URLs."""
+    urls: list[str]
+    force_rescrape: bool = False
+    login: bool = False
+    username: Optional[str] = None
+    password: Optional[str] = None  # Required if login=True, encrypted in memory
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import os
 from typing import Optional
 
@@ -40,6 +41,17 @@ def _get_fernet_key() -> bytes:
         # Use default key for development (not secure for production!)
         master_key = "ao3tracker_default_key_change_in_production"
     
+    return _derive_fernet_key(master_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _derive_fernet_key(master_key: str) -> bytes:
+    """
+    Derive the Fernet key for a master key.
+    
+    PBKDF2 with _KEY_ITERATIONS rounds dominates every encrypt/decrypt call,
+    so the result is cached per master key.
+    """
     # Derive a consistent Fernet key from the master key
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
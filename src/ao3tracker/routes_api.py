@@ -3,10 +3,10 @@ from __future__ import annotations
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
 
 from ao3tracker.db import get_connection, mark_updates_as_read
 from ao3tracker.models import (
+    ScrapeRequest,
     Update,
     UpdateWithWork,
     UpdatesResponse,
@@ -93,8 +93,6 @@ async def api_list_updates(
         update_dict["is_read"] = bool(update_dict.get("is_read", 0))
         updates.append(UpdateWithWork(**update_dict))
     
-    conn.close()
-    
     total_pages = (total + page_size - 1) // page_size
     
     return UpdatesResponse(
@@ -159,7 +157,6 @@ async def api_list_works(
     rows = cur.execute(query, params).fetchall()
     
     works = [Work(**dict(row)) for row in rows]
-    conn.close()
     
     total_pages = (total + page_size - 1) // page_size
     
@@ -197,7 +194,6 @@ async def api_work_detail(work_id: int):
     """, (work_id,)).fetchone()
     
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
     
     work = Work(**dict(work_row))
@@ -216,8 +212,6 @@ async def api_work_detail(work_id: int):
         update_dict["is_read"] = bool(update_dict.get("is_read", 0))
         updates.append(Update(**update_dict))
     
-    conn.close()
-    
     work_detail = WorkDetail(**work.model_dump(), updates=updates)
     return work_detail
 
@@ -231,24 +225,13 @@ async def api_mark_work_read(work_id: int):
     # Verify work exists
     work_row = cur.execute("SELECT id FROM works WHERE id = ?", (work_id,)).fetchone()
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
     
     mark_updates_as_read(conn, work_id)
-    conn.close()
     
     return {"status": "success", "message": f"All updates for work {work_id} marked as read"}
 
 
-class ScrapeRequest(BaseModel):
-    """Request model for scraping works from URLs."""
-    urls: list[str]
-    force_rescrape: bool = False
-    login: bool = False
-    username: Optional[str] = None
-    password: Optional[str] = None  # Required if login=True, encrypted in memory
-
-
 @router.post("/works/scrape-from-urls")
 async def api_scrape_works_from_urls(request: ScrapeRequest):
     """
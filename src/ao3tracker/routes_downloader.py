@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from pydantic import BaseModel
 
 from ao3tracker.downloader_config import get_all_settings, get_setting, set_setting
 from ao3tracker.downloader_service import (
@@ -16,76 +15,21 @@ from ao3tracker.downloader_service import (
     get_progress,
     list_jobs,
 )
+from ao3tracker.models import (
+    DownloadFromFileRequest,
+    DownloadFromLinkRequest,
+    DownloadMissingSeriesRequest,
+    GetLinksRequest,
+    IgnoreListRequest,
+    MarkedForLaterRequest,
+    PinboardRequest,
+    RedownloadRequest,
+    UpdateIncompleteRequest,
+)
 
 router = APIRouter(prefix="/api/v1/downloader", tags=["downloader"])
 
 
-# Request models
-class DownloadFromLinkRequest(BaseModel):
-    link: str
-    file_types: List[str] = ["EPUB"]
-    pages: Optional[int] = None
-    include_series: bool = False
-    download_images: bool = False
-    login: bool = False
-    username: Optional[str] = None
-    password: Optional[str] = None  # Required if login=True, encrypted in memory
-
-
-class GetLinksRequest(BaseModel):
-    link: str
-    pages: Optional[int] = None
-    include_series: bool = False
-    include_metadata: bool = False
-    login: bool = False
-    username: Optional[str] = None
-    password: Optional[str] = None  # Required if login=True, encrypted in memory
-
-
-class DownloadFromFileRequest(BaseModel):
-    file_content: str
-    file_types: List[str] = ["EPUB"]
-    include_series: bool = True
-    download_images: bool = False
-    login: bool = False
-    username: Optional[str] = None
-    password: Optional[str] = None  # Required if login=True, encrypted in memory
-
-
-class UpdateIncompleteRequest(BaseModel):
-    folder_path: str
-    file_types: List[str] = ["EPUB"]
-
-
-class DownloadMissingSeriesRequest(BaseModel):
-    folder_path: str
-    file_types: List[str] = ["EPUB"]
-
-
-class RedownloadRequest(BaseModel):
-    folder_path: str
-    source_format: str
-    target_formats: List[str]
-
-
-class MarkedForLaterRequest(BaseModel):
-    login: bool = True
-    mark_as_read: bool = True
-    username: Optional[str] = None
-    password: Optional[str] = None  # Required if login=True, encrypted in memory
-
-
-class PinboardRequest(BaseModel):
-    api_token: str
-    include_unread: bool = True
-    date_from: Optional[str] = None
-
-
-class IgnoreListRequest(BaseModel):
-    links: List[str]
-    check_deleted: bool = False
-
-
 # Job creation endpoints
 @router.post("/jobs/download-from-link")
 async def create_download_job(
@@ -97,7 +97,6 @@ async def list_updates(
     from ao3tracker.db import get_last_ingestion_time
     last_ingestion_time = get_last_ingestion_time(conn)
     
-    conn.close()
     return templates.TemplateResponse(
         "updates.html",
         {
@@ -225,7 +224,6 @@ async def list_works(
     
     total_pages = (total + page_size - 1) // page_size
     
-    conn.close()
     return templates.TemplateResponse(
         "works.html",
         {
@@ -336,7 +334,6 @@ async def work_detail(work_id: int, request: Request):
     """, (work_id,)).fetchone()
 
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
 
     work = dict(work_row)
@@ -364,7 +361,6 @@ async def work_detail(work_id: int, request: Request):
     # Count unread updates
     unread_count = sum(1 for u in updates if not u.get("is_read", 0))
     
-    conn.close()
     return templates.TemplateResponse(
         "work_detail.html",
         {
@@ -386,11 +382,9 @@ async def mark_work_read(work_id: int, request: Request):
     # Verify work exists
     work_row = cur.execute("SELECT id FROM works WHERE id = ?", (work_id,)).fetchone()
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
     
     mark_updates_as_read(conn, work_id)
-    conn.close()
     
     # Redirect back to work detail page
     return RedirectResponse(url=f"/works/{work_id}", status_code=303)
@@ -433,7 +427,6 @@ async def search_works(
         
         total_pages = (total + page_size - 1) // page_size
     
-    conn.close()
     return templates.TemplateResponse(
         "search.html",
         {
@@ -471,8 +464,6 @@ async def status_page(request: Request):
     """).fetchone()
     last_ingestion_time = last_ingestion_row[0] if last_ingestion_row and last_ingestion_row[0] else None
     
-    conn.close()
-    
     return templates.TemplateResponse(
         "status.html",
         {
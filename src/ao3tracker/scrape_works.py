@@ -174,6 +174,5 @@ def scrape_and_store_works(
     if progress_callback:
         progress_callback(f"Completed: {stats['inserted']} inserted, {stats['updated']} updated, {len(stats['errors'])} errors")
     
-    conn.close()
     return stats
 
@@ -127,7 +127,6 @@ async def list_updates(
     
     total_pages = (total + page_size - 1) // page_size
     
-    conn.close()
     return templates.TemplateResponse(
         "updates.html",
         {
@@ -190,7 +189,6 @@ async def list_works(
     
     total_pages = (total + page_size - 1) // page_size
     
-    conn.close()
     return templates.TemplateResponse(
         "works.html",
         {
@@ -225,7 +223,6 @@ async def work_detail(work_id: int, request: Request):
     """, (work_id,)).fetchone()
 
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
 
     work = dict(work_row)
@@ -253,7 +250,6 @@ async def work_detail(work_id: int, request: Request):
     # Count unread updates
     unread_count = sum(1 for u in updates if not u.get("is_read", 0))
     
-    conn.close()
     return templates.TemplateResponse(
         "work_detail.html",
         {
@@ -275,11 +271,9 @@ async def mark_work_read(work_id: int, request: Request):
     # Verify work exists
     work_row = cur.execute("SELECT id FROM works WHERE id = ?", (work_id,)).fetchone()
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
     
     mark_updates_as_read(conn, work_id)
-    conn.close()
     
     # Redirect back to work detail page
     from fastapi.responses import RedirectResponse
@@ -435,8 +429,6 @@ async def api_list_updates(
         update_dict["is_read"] = bool(update_dict.get("is_read", 0))
         updates.append(UpdateWithWork(**update_dict))
     
-    conn.close()
-    
     total_pages = (total + page_size - 1) // page_size
     
     return UpdatesResponse(
@@ -484,7 +476,6 @@ async def api_list_works(
     rows = cur.execute(query, params).fetchall()
     
     works = [Work(**dict(row)) for row in rows]
-    conn.close()
     
     total_pages = (total + page_size - 1) // page_size
     
@@ -510,7 +501,6 @@ async def api_work_detail(work_id: int):
     """, (work_id,)).fetchone()
     
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
     
     work = Work(**dict(work_row))
@@ -529,8 +519,6 @@ async def api_work_detail(work_id: int):
         update_dict["is_read"] = bool(update_dict.get("is_read", 0))
         updates.append(Update(**update_dict))
     
-    conn.close()
-    
     work_detail = WorkDetail(**work.model_dump(), updates=updates)
     return work_detail
 
@@ -544,11 +532,9 @@ async def api_mark_work_read(work_id: int):
     # Verify work exists
     work_row = cur.execute("SELECT id FROM works WHERE id = ?", (work_id,)).fetchone()
     if work_row is None:
-        conn.close()
         raise HTTPException(status_code=404, detail="Work not found")
     
     mark_updates_as_read(conn, work_id)
-    conn.close()
     
     return {"status": "success", "message": f"All updates for work {work_id} marked as read"}
 
@@ -594,7 +580,6 @@ async def search_works(
         
         total_pages = (total + page_size - 1) // page_size
     
-    conn.close()
     return templates.TemplateResponse(
         "search.html",
         {
@@ -632,8 +617,6 @@ async def status_page(request: Request):
     """).fetchone()
     last_ingestion_time = last_ingestion_row[0] if last_ingestion_row and last_ingestion_row[0] else None
     
-    conn.close()
-    
     return templates.TemplateResponse(
         "status.html",
         {
@@ -0,0 +1,134 @@
+"""
+Tests for the visited-list contract shared by concurrent file downloads.
+
+Run from the repository root with:
+    PYTHONPATH=src python -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+def _fake_ao3downloader() -> dict:
+    """Build stand-in ao3downloader modules exposing the names the wrappers import."""
+    modules = {}
+    for name in ("exceptions", "parse_soup", "parse_text", "strings", "actions", "actions.shared", "ao3", "fileio", "repo"):
+        modules[f"ao3downloader.{name}"] = types.ModuleType(f"ao3downloader.{name}")
+    package = types.ModuleType("ao3downloader")
+    package.__path__ = []
+    for name in ("exceptions", "parse_soup", "parse_text", "strings", "actions", "ao3", "fileio", "repo"):
+        setattr(package, name, modules[f"ao3downloader.{name}"])
+    modules["ao3downloader"] = package
+    modules["ao3downloader.actions"].shared = modules["ao3downloader.actions.shared"]
+    modules["ao3downloader.ao3"].Ao3 = type("Ao3", (), {})
+    modules["ao3downloader.fileio"].FileOps = type("FileOps", (), {})
+    modules["ao3downloader.repo"].Repository = type("Repository", (), {})
+    return modules
+
+
+def _import_wrappers():
+    """Import downloader_wrappers against fake ao3downloader modules, without cloning."""
+    if "ao3tracker.downloader_wrappers" in sys.modules:
+        return sys.modules["ao3tracker.downloader_wrappers"]
+    with mock.patch(
+        "ao3tracker.downloader_setup.ensure_ao3downloader_installed",
+        return_value=Path(tempfile.gettempdir()),
+    ), mock.patch.dict(sys.modules, _fake_ao3downloader()):
+        return importlib.import_module("ao3tracker.downloader_wrappers")
+
+
+wrappers = _import_wrappers()
+
+
+class FakeAo3:
+    """Mimics Ao3.download: skip visited links, otherwise download then append."""
+
+    def __init__(self, fail_links=(), started=None, release=None):
+        self.fail_links = set(fail_links)
+        self.downloaded = []
+        self.started = started
+        self.release = release
+
+    def download(self, link, visited):
+        if link in visited:
+            return
+        if self.started is not None:
+            self.started.set()
+            self.release.wait(5)
+        if link in self.fail_links:
+            raise RuntimeError(f"download failed: {link}")
+        self.downloaded.append(link)
+        visited.append(link)
+
+
+class ClaimedLinksTest(unittest.TestCase):
+    def test_membership_does_not_mark_visited(self):
+        visited = wrappers._ClaimedLinks(["a"])
+        self.assertIn("a", visited)
+        self.assertNotIn("b", visited)
+        self.assertNotIn("b", visited)
+        self.assertEqual(list(visited), ["a"])
+
+    def test_append_dedupes(self):
+        visited = wrappers._ClaimedLinks(["a", "a"])
+        visited.append("a")
+        visited.append("b")
+        self.assertEqual(list(visited), ["a", "b"])
+
+    def test_claim_is_exclusive_until_released(self):
+        visited = wrappers._ClaimedLinks()
+        self.assertTrue(visited.claim("a"))
+        self.assertFalse(visited.claim("a"))
+        self.assertNotIn("a", visited)
+        visited.release("a")
+        self.assertTrue(visited.claim("a"))
+
+    def test_claim_refuses_visited_link(self):
+        visited = wrappers._ClaimedLinks(["a"])
+        self.assertFalse(visited.claim("a"))
+
+
+class DownloadClaimedTest(unittest.TestCase):
+    def test_successful_download_marks_visited(self):
+        ao3 = FakeAo3()
+        visited = wrappers._ClaimedLinks()
+        wrappers._download_claimed(ao3, "a", visited)
+        self.assertEqual(ao3.downloaded, ["a"])
+        self.assertIn("a", visited)
+
+    def test_failed_download_releases_claim(self):
+        ao3 = FakeAo3(fail_links={"a"})
+        visited = wrappers._ClaimedLinks()
+        with self.assertRaises(RuntimeError):
+            wrappers._download_claimed(ao3, "a", visited)
+        self.assertNotIn("a", visited)
+        self.assertTrue(visited.claim("a"))
+
+    def test_concurrent_claims_download_once(self):
+        started = threading.Event()
+        release = threading.Event()
+        ao3 = FakeAo3(started=started, release=release)
+        visited = wrappers._ClaimedLinks()
+
+        first = threading.Thread(target=wrappers._download_claimed, args=(ao3, "a", visited))
+        first.start()
+        self.assertTrue(started.wait(5))
+        # The first download is still in progress, so this call must skip it
+        wrappers._download_claimed(ao3, "a", visited)
+        release.set()
+        first.join(5)
+
+        self.assertEqual(ao3.downloaded, ["a"])
+        self.assertIn("a", visited)
+
+
+if __name__ == "__main__":
+    unittest.main()